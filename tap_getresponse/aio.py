@@ -0,0 +1,155 @@
+"""Optional asyncio engine sending the API requests as coroutines.
+
+Requests run on a single event loop, in a background thread, through an
+``httpx.AsyncClient``. A semaphore shared by all streams bounds the number of
+requests in flight. Responses are converted back to ``requests.Response`` objects,
+so that validation, parsing and record emission stay on the regular code path.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import typing as t
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None  # type: ignore[assignment]
+
+if t.TYPE_CHECKING:
+    from concurrent.futures import Future
+
+_T = t.TypeVar("_T")
+
+
+class AsyncEngine:
+    """Event loop running API requests as coroutines in a background thread."""
+
+    def __init__(self, concurrency: int, pool_size: int) -> None:
+        """Start the event loop.
+
+        Args:
+            concurrency: Maximum number of requests in flight.
+            pool_size: Maximum number of keep-alive connections.
+
+        Raises:
+            ImportError: If ``httpx`` is not installed.
+        """
+        if httpx is None:
+            msg = (
+                "The async engine requires httpx: "
+                "install it with `pip install tap-getresponse[async]`"
+            )
+            raise ImportError(msg)
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self._thread.start()
+        self.semaphore, self.client = self.run(self._open(concurrency, pool_size))
+
+    @staticmethod
+    async def _open(
+        concurrency: int,
+        pool_size: int,
+    ) -> tuple[asyncio.Semaphore, httpx.AsyncClient]:
+        """Create the loop-bound semaphore and HTTP client."""
+        limits = httpx.Limits(
+            max_connections=max(concurrency, pool_size),
+            max_keepalive_connections=pool_size,
+        )
+        return asyncio.Semaphore(concurrency), httpx.AsyncClient(limits=limits)
+
+    def submit(self, coroutine: t.Coroutine[t.Any, t.Any, _T]) -> Future[_T]:
+        """Schedule a coroutine on the event loop.
+
+        Args:
+            coroutine: The coroutine.
+
+        Returns:
+            A future resolved with the coroutine result.
+        """
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop)
+
+    def run(self, coroutine: t.Coroutine[t.Any, t.Any, _T]) -> _T:
+        """Run a coroutine on the event loop and wait for its result.
+
+        Args:
+            coroutine: The coroutine.
+
+        Returns:
+            The coroutine result.
+        """
+        return self.submit(coroutine).result()
+
+    def gather(self, coroutines: t.Iterable[t.Awaitable[_T]]) -> list[_T]:
+        """Run coroutines concurrently and wait for all their results.
+
+        Args:
+            coroutines: The coroutines.
+
+        Returns:
+            The coroutine results, in order.
+        """
+
+        async def _gather() -> list[_T]:
+            return list(await asyncio.gather(*coroutines))
+
+        return self.run(_gather())
+
+    async def send(
+        self,
+        prepared_request: requests.PreparedRequest,
+        timeout: float | None,
+    ) -> requests.Response:
+        """Send a prepared request once a slot of the semaphore is free.
+
+        Transport errors are raised as their ``requests`` counterparts, so that
+        the usual retries apply.
+
+        Args:
+            prepared_request: The request to send.
+            timeout: The request timeout, in seconds.
+
+        Returns:
+            The HTTP response.
+
+        Raises:
+            ReadTimeout: If the request timed out.
+            ConnectionError: If the request could not be sent.
+        """
+        async with self.semaphore:
+            try:
+                response = await self.client.request(
+                    t.cast(str, prepared_request.method),
+                    t.cast(str, prepared_request.url),
+                    headers=dict(prepared_request.headers),
+                    content=prepared_request.body,
+                    timeout=timeout,
+                )
+            except httpx.TimeoutException as exc:
+                raise requests.exceptions.ReadTimeout(str(exc)) from exc
+            except httpx.TransportError as exc:
+                raise requests.exceptions.ConnectionError(str(exc)) from exc
+
+        result = requests.Response()
+        result.status_code = response.status_code
+        result.reason = response.reason_phrase
+        result.headers = CaseInsensitiveDict(response.headers.items())
+        result.url = str(response.url)
+        result.encoding = response.encoding
+        result.elapsed = response.elapsed
+        result.request = prepared_request
+        result._content = response.content  # noqa: SLF001
+        # The body is fully read: `iter_content` serves it without a `raw` stream.
+        result._content_consumed = True  # type: ignore[attr-defined]  # noqa: SLF001
+        return result
+
+    def close(self) -> None:
+        """Close the HTTP client and stop the event loop."""
+        self.run(self.client.aclose())
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join()
+        self.loop.close()
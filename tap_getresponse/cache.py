@@ -0,0 +1,178 @@
+"""On-disk cache of API responses, revalidated with conditional requests."""
+
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    url TEXT PRIMARY KEY,
+    etag TEXT,
+    last_modified TEXT,
+    body BLOB NOT NULL,
+    digest TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    stored_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+)
+"""
+
+
+def content_hash(body: bytes) -> str:
+    """Return a digest identifying a response body.
+
+    Args:
+        body: The response body.
+
+    Returns:
+        The SHA-256 digest of the body.
+    """
+    return hashlib.sha256(body).hexdigest()
+
+
+@dataclass
+class CachedResponse:
+    """A response body and the validators sent to revalidate it."""
+
+    etag: str | None
+    last_modified: str | None
+    body: bytes
+    digest: str
+
+
+class ResponseCache:
+    """SQLite cache of response bodies keyed by request URL.
+
+    Each entry keeps the ``ETag`` and ``Last-Modified`` headers of the response,
+    and a hash of its body: a downloaded body equal to the cached one only refreshes
+    the entry. Entries are dropped once older than ``ttl`` seconds, and the least
+    recently used ones are evicted when the cache exceeds ``max_bytes``. A single
+    connection is shared by all threads, and writes are committed in batches.
+    """
+
+    #: Number of entries written per transaction.
+    batch_size = 1000
+
+    def __init__(self, path: str, ttl: float, max_bytes: int) -> None:
+        """Open or create the cache.
+
+        Args:
+            path: The SQLite database path.
+            ttl: Maximum age of an entry, in seconds.
+            max_bytes: Maximum total size of the cached bodies, in bytes.
+        """
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._uncommitted = 0
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute(_SCHEMA)
+
+    def get(self, url: str) -> CachedResponse | None:
+        """Return the cached response of a URL, if still fresh.
+
+        Args:
+            url: The request URL.
+
+        Returns:
+            The cached response, or ``None``.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT etag, last_modified, body, digest FROM responses "
+                "WHERE url = ? AND stored_at >= ?",
+                (url, time.time() - self.ttl),
+            ).fetchone()
+        return CachedResponse(*row) if row else None
+
+    def put(
+        self,
+        url: str,
+        body: bytes,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> None:
+        """Store a response body with its validators.
+
+        Args:
+            url: The request URL.
+            body: The response body.
+            etag: The ``ETag`` response header.
+            last_modified: The ``Last-Modified`` response header.
+        """
+        digest = content_hash(body)
+        now = time.time()
+        with self._lock:
+            # An unchanged body is only marked fresh, instead of being rewritten.
+            unchanged = self._connection.execute(
+                "UPDATE responses SET stored_at = ?, accessed_at = ? "
+                "WHERE url = ? AND digest = ? AND etag IS ? AND last_modified IS ?",
+                (now, now, url, digest, etag, last_modified),
+            ).rowcount
+            if not unchanged:
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (url, etag, last_modified, body, digest, len(body), now, now),
+                )
+            self.misses += 1
+            self._count_write()
+
+    def touch(self, url: str) -> None:
+        """Mark a cached response as revalidated and recently used.
+
+        Args:
+            url: The request URL.
+        """
+        now = time.time()
+        with self._lock:
+            self._connection.execute(
+                "UPDATE responses SET stored_at = ?, accessed_at = ? WHERE url = ?",
+                (now, now, url),
+            )
+            self.hits += 1
+            self._count_write()
+
+    def _count_write(self) -> None:
+        """Commit the pending writes once a batch is complete."""
+        self._uncommitted += 1
+        if self._uncommitted >= self.batch_size:
+            self._connection.commit()
+            self._uncommitted = 0
+
+    def evict(self) -> None:
+        """Drop expired entries, then the least recently used ones over the cap.
+
+        The pending writes are committed along with the evictions.
+        """
+        with self._lock, self._connection:
+            self._connection.execute(
+                "DELETE FROM responses WHERE stored_at < ?",
+                (time.time() - self.ttl,),
+            )
+            self._connection.execute(
+                """
+                DELETE FROM responses WHERE url IN (
+                    SELECT url FROM (
+                        SELECT url, SUM(size) OVER (
+                            ORDER BY accessed_at DESC, url
+                        ) AS total
+                        FROM responses
+                    ) WHERE total > ?
+                )
+                """,
+                (self.max_bytes,),
+            )
+            self._uncommitted = 0
+
+    def close(self) -> None:
+        """Evict stale entries and close the database."""
+        self.evict()
+        with self._lock:
+            self._connection.close()
@@ -2,14 +2,88 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import datetime
+import queue
+import sys
+import threading
 import typing as t
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import cached_property
+from http import HTTPStatus
 
+import pendulum
 import requests
+from jsonschema.validators import validator_for  # type: ignore[import-untyped]
+from singer_sdk import metrics
+from singer_sdk import typing as th
+from singer_sdk._singerlib import RecordMessage, write_message
 from singer_sdk.authenticators import APIKeyAuthenticator
+from singer_sdk.exceptions import ConfigValidationError, RetriableAPIError
 from singer_sdk.helpers.jsonpath import extract_jsonpath
 from singer_sdk.pagination import BasePageNumberPaginator
 from singer_sdk.streams import RESTStream
 
+from tap_getresponse.aio import AsyncEngine
+from tap_getresponse.cache import CachedResponse, ResponseCache
+from tap_getresponse.fingerprints import FingerprintIndex, fingerprint
+from tap_getresponse.instrumentation import Phase
+from tap_getresponse.jsonstream import iter_json_records
+from tap_getresponse.pagesize import PageSizeController
+from tap_getresponse.ratelimit import RateLimitMetric
+from tap_getresponse.serialization import format_message
+
+if t.TYPE_CHECKING:
+    from tap_getresponse.tap import TapGetResponse
+
+# API URL root used when no `base_url` is configured.
+DEFAULT_BASE_URL = "https://api3.getresponse360.pl/v3"
+
+# GetResponse rejects more than 10 simultaneous requests per account.
+# Source: https://apireference.getresponse.com/#section/Limits
+MAX_CONCURRENT_REQUESTS = 10
+
+# The API filters dates by day.
+DATE_FORMAT = "%Y-%m-%d"
+
+# Size of the response body chunks parsed when streaming responses.
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Number of parent records buffered per worker before child streams are synced.
+CHILD_BATCH_FACTOR = 4
+
+# Context key and record property identifying the account of a record, when
+# several accounts are synced.
+ACCOUNT_ID_KEY = "account_id"
+
+# Marks the end of the records of a prefetched partition.
+_END_OF_PARTITION = object()
+
+
+def _context_key(context: dict | None) -> tuple:
+    """Return a hashable key identifying a stream context."""
+    return tuple(sorted((context or {}).items()))
+
+
+def _is_slow_page_error(exc: Exception) -> bool:
+    """Return whether a request failed because the page took too long to serve."""
+    if isinstance(exc, requests.exceptions.Timeout):
+        return True
+    return (
+        isinstance(exc, RetriableAPIError)
+        and exc.response is not None
+        and exc.response.status_code == HTTPStatus.GATEWAY_TIMEOUT
+    )
+
+
+class PageToken(t.NamedTuple):
+    """A page of a listing requested with an explicit page size."""
+
+    page: int
+    per_page: int
+
 
 class GetResponsePaginator(BasePageNumberPaginator):
     """
@@ -18,8 +92,8 @@ class GetResponsePaginator(BasePageNumberPaginator):
 
     start_value = 1
 
-    def __init__(self):
-        super().__init__(start_value=self.start_value)
+    def __init__(self, start_value: int | None = None):
+        super().__init__(start_value=start_value or self.start_value)
 
     def get_next(self, response) -> int | None:
         if "currentPage" in response.headers:
@@ -38,11 +112,132 @@ class GetResponsePaginator(BasePageNumberPaginator):
 class GetResponseStream(RESTStream):
     """GetResponse stream class."""
 
+    #: Whether the endpoint accepts the ``fields`` parameter for all schema properties.
+    field_selection = True
+
+    #: Fields always requested, e.g. because child contexts are built from them.
+    required_fields: t.ClassVar[list[str]] = []
+
+    #: Whether records can be built from the parent listing, with the
+    #: ``hydrate_from_parent`` setting, instead of one request per parent record.
+    hydrate_from_parent = False
+
+    #: Extra URL parameters the parent listing needs to include hydrated fields.
+    hydration_params: t.ClassVar[dict[str, str]] = {}
+
+    #: Whether the replication key range is requested in ``date_window_days`` slices.
+    date_windowed = False
+
+    #: Fields the endpoint filters on with ``query[...]`` parameters, usable in the
+    #: ``filters`` setting.
+    filterable_fields: t.ClassVar[list[str]] = []
+
+    #: Whether responses are kept in the ``cache_path`` cache and revalidated with
+    #: conditional requests on the next runs.
+    cacheable = False
+
+    #: Fields whose values change along with a record, identifying its version.
+    fingerprint_fields: t.ClassVar[list[str]] = []
+
+    #: Whether the stream skips parents whose fingerprint did not change since the
+    #: last sync, with the ``fingerprint_path`` setting.
+    skip_unchanged_parents = False
+
+    #: Fields read by :meth:`is_final`.
+    final_fields: t.ClassVar[list[str]] = []
+
+    #: Whether the stream stops syncing parents once they are final, with the
+    #: ``freeze_finished_newsletters`` setting.
+    freeze_final_parents = False
+
+    #: Field dating the records, after which their children have no new records.
+    horizon_field: str | None = None
+
+    #: Whether the stream skips parents dated before the activity horizon, with the
+    #: ``newsletter_activity_days`` setting.
+    skip_stale_parents = False
+
+    #: Whether the stream needs every parent record, and not only the ones changed
+    #: since the parent bookmark, e.g. because its records do not change the parent.
+    requires_all_parents = False
+
+    def __init__(self, *args: t.Any, **kwargs: t.Any) -> None:
+        """Initialize the stream and its child fan-out buffers."""
+        super().__init__(*args, **kwargs)
+        self._pending_child_contexts: list[dict] = []
+        self._prefetched_records: dict[tuple, list[dict]] = {}
+        self._current_record: dict | None = None
+        self._current_context: dict | None = None
+        self._emitted_records = 0
+        self._partition_buffers: dict[tuple, queue.Queue] = {}
+        self._pending_fingerprints: dict[tuple, tuple[str, list[str]]] = {}
+        self._pending_freezes: dict[tuple, list[GetResponseStream]] = {}
+        if self.tap.accounts:
+            # Records of all the accounts share the stream, keyed by account.
+            self.schema = {  # type: ignore[misc]
+                **self.schema,
+                "properties": {
+                    ACCOUNT_ID_KEY: th.StringType().type_dict,
+                    **self.schema["properties"],
+                },
+            }
+            self.primary_keys = [ACCOUNT_ID_KEY, *(self.primary_keys or [])]
+
+    @property
+    def tap(self) -> TapGetResponse:
+        """Return the tap of the stream, with the state it shares across streams."""
+        return t.cast("TapGetResponse", self._tap)
+
     @property
     def url_base(self) -> str:
         """Return the API URL root, configurable via tap settings."""
-        # TODO: retrieve it from self.config for custom base url or use it by default
-        return "https://api3.getresponse360.pl/v3"
+        return self.config.get("base_url", DEFAULT_BASE_URL).rstrip("/")
+
+    @property
+    def partitions(self) -> list[dict] | None:
+        """Return one partition per account for top-level streams, if configured.
+
+        Returns:
+            A list of partition contexts, or the partitions found in the state.
+        """
+        if self.parent_stream_type is None and self.tap.accounts:
+            return [{ACCOUNT_ID_KEY: account_id} for account_id in self.tap.accounts]
+        return super().partitions
+
+    def get_url(self, context: dict | None) -> str:
+        """Return the endpoint URL, on the base URL of the context account.
+
+        Args:
+            context: The stream context.
+
+        Returns:
+            The endpoint URL.
+        """
+        url = super().get_url(context)
+        account = self.tap.get_account(context)
+        if account and account.get("base_url"):
+            url = account["base_url"].rstrip("/") + url[len(self.url_base) :]
+        return url
+
+    def prepare_request(
+        self,
+        context: dict | None,
+        next_page_token: t.Any | None,  # noqa: ANN401
+    ) -> requests.PreparedRequest:
+        """Prepare a request, with the token and domain of the context account.
+
+        Args:
+            context: The stream context.
+            next_page_token: The next page index or value.
+
+        Returns:
+            The prepared request.
+        """
+        prepared_request = super().prepare_request(context, next_page_token)
+        account = self.tap.get_account(context)
+        if account:
+            prepared_request.headers.update(self.tap.get_account_headers(account))
+        return prepared_request
 
     records_jsonpath = "$[*]"  # Or override `parse_response`.
 
@@ -51,17 +246,21 @@ class GetResponseStream(RESTStream):
 
     @property
     def authenticator(self) -> APIKeyAuthenticator:
-        """Return a new authenticator object.
+        """Return the authenticator shared by all the streams of the tap.
 
         Returns:
             An authenticator instance.
         """
-        return APIKeyAuthenticator.create_for_stream(
-            self,
-            key="X-Auth-Token",
-            value=f"api-key {self.config.get('auth_token', '')}",
-            location="header",
-        )
+        return self.tap.get_authenticator(self)
+
+    @property
+    def requests_session(self) -> requests.Session:
+        """Return the HTTP session shared by all the streams of the tap.
+
+        Returns:
+            The `requests.Session` object for HTTP requests.
+        """
+        return self.tap.requests_session
 
     @property
     def http_headers(self) -> dict:
@@ -73,22 +272,160 @@ class GetResponseStream(RESTStream):
         headers = {}
         if "user_agent" in self.config:
             headers["User-Agent"] = self.config.get("user_agent")
+        if "domain" in self.config:
+            # GetResponse MAX accounts are identified by their domain.
+            headers["X-Domain"] = self.config["domain"]
         # If not using an authenticator, you may also provide inline auth headers:
         return headers
 
-    def get_new_paginator(self) -> GetResponsePaginator:
+    def get_new_paginator(self, start_value: int | None = None) -> GetResponsePaginator:
         """Create a new pagination helper instance.
 
         https://sdk.meltano.com/en/v0.25.0/guides/pagination-classes.html#how-to-migrate
 
+        Args:
+            start_value: The first page to request, when resuming a listing.
+
         Returns:
             A pagination helper instance.
         """
-        return GetResponsePaginator()
+        return GetResponsePaginator(start_value)
+
+    def get_selected_fields(self) -> list[str] | None:
+        """Return the top-level fields to request from the API.
+
+        Only the properties selected in the catalog are requested, plus the keys
+        needed by the tap itself. Parents synced only for their children therefore
+        download their keys alone.
+
+        Returns:
+            The list of fields, or ``None`` to request the whole objects.
+        """
+        if not self.field_selection:
+            return None
+        properties = self.api_properties
+        selected = [
+            name
+            for name in properties
+            if self.selected and self.mask.get(("properties", name), True)
+        ]
+        hydrated = [
+            name
+            for child in self.hydrated_children
+            for name in child.get_selected_fields() or child.api_properties
+        ]
+        if len(selected) == len(properties) and not hydrated:
+            return None
+        for name in [
+            *(pk for pk in self.primary_keys or [] if pk != ACCOUNT_ID_KEY),
+            *([self.replication_key] if self.replication_key else []),
+            *self.required_fields,
+            *(self.fingerprint_fields if self.fingerprinted_children else []),
+            *(self.final_fields if self.frozen_children else []),
+            *(
+                [self.horizon_field]
+                if self.horizon_field and self.stale_children
+                else []
+            ),
+            *hydrated,
+        ]:
+            if name not in selected:
+                selected.append(name)
+        return selected
+
+    @property
+    def api_properties(self) -> list[str]:
+        """Return the schema properties returned by the API."""
+        return [name for name in self.schema["properties"] if name != ACCOUNT_ID_KEY]
+
+    @property
+    def children(self) -> list[GetResponseStream]:
+        """Return the child streams, as GetResponse streams."""
+        return t.cast("list[GetResponseStream]", self.child_streams)
+
+    @property
+    def hydrated_children(self) -> list[GetResponseStream]:
+        """Return the selected child streams built from this stream's records."""
+        if not self.config.get("hydrate_from_parent", False):
+            return []
+        return [
+            child
+            for child in self.children
+            if child.hydrate_from_parent and child.selected
+        ]
+
+    @property
+    def push_down_bookmark(self) -> bool:
+        """Return whether the listing only requests records changed since the bookmark.
+
+        Unchanged records are requested too while a selected child stream needs
+        every parent.
+        """
+        return not any(
+            child.requires_all_parents
+            and (child.selected or child.has_selected_descendents)
+            for child in self.children
+        )
+
+    @property
+    def fingerprinted_children(self) -> list[GetResponseStream]:
+        """Return the selected child streams skipping unchanged parent records."""
+        if self.tap.fingerprint_index is None or not self.fingerprint_fields:
+            return []
+        return [
+            child
+            for child in self.children
+            if child.skip_unchanged_parents and child.selected
+        ]
+
+    def get_fingerprint(self, record: dict) -> str:
+        """Return a digest identifying the version of a record.
+
+        Args:
+            record: The record.
+
+        Returns:
+            A digest of the ``fingerprint_fields`` values.
+        """
+        return fingerprint([record.get(name) for name in self.fingerprint_fields])
+
+    @property
+    def frozen_children(self) -> list[GetResponseStream]:
+        """Return the selected child streams skipping final parent records."""
+        if not self.config.get("freeze_finished_newsletters", False):
+            return []
+        return [
+            child
+            for child in self.children
+            if child.freeze_final_parents and child.selected
+        ]
+
+    @property
+    def stale_children(self) -> list[GetResponseStream]:
+        """Return the selected child streams skipping parents older than the horizon."""
+        days = self.config.get("newsletter_activity_days")
+        if self.horizon_field is None or not days:
+            return []
+        return [
+            child
+            for child in self.children
+            if child.skip_stale_parents and child.selected
+        ]
+
+    def is_final(self, record: dict) -> bool:  # noqa: ARG002
+        """Return whether a record, and the records of its children, won't change.
+
+        Args:
+            record: The record.
+
+        Returns:
+            Whether the record is final.
+        """
+        return False
 
     def get_url_params(
         self,
-        context: dict | None,  # noqa: ARG002
+        context: dict | None,
         next_page_token: t.Any | None,  # noqa: ANN401
     ) -> dict[str, t.Any]:
         """Return a dictionary of values to be used in URL parameterization.
@@ -101,14 +438,1097 @@ class GetResponseStream(RESTStream):
             A dictionary of URL query parameters.
         """
         params: dict = {}
-        params["perPage"] = self.config.get("per_page", 1000)
-        if next_page_token:
-            params["page"] = next_page_token
+        page, per_page = next_page_token, self.per_page
+        if isinstance(next_page_token, PageToken):
+            page, per_page = next_page_token
+        params["perPage"] = per_page
+        if page:
+            params["page"] = page
+        fields = self.get_selected_fields()
+        if fields:
+            params["fields"] = ",".join(fields)
+        for child in self.hydrated_children:
+            params.update(child.hydration_params)
+        params.update(self.query_filters)
         if self.replication_key:
-            params["sort"] = "asc"
-            params["order_by"] = self.replication_key
+            params[f"sort[{self.replication_key}]"] = "ASC"
+            # Push the bookmark down so the API only returns changed records.
+            # The API filters by day, so records of the bookmark day are re-read.
+            start_date = self.get_starting_timestamp(context)
+            if start_date and not self.date_windowed and self.push_down_bookmark:
+                params[f"query[{self.replication_key}][from]"] = start_date.strftime(
+                    DATE_FORMAT,
+                )
         return params
 
+    @cached_property
+    def query_filters(self) -> dict[str, t.Any]:
+        """Return the ``query[...]`` parameters of the stream ``filters`` setting.
+
+        A field is filtered on a value, or on a range given as ``from`` and ``to``
+        bounds, e.g. ``{"status": "enabled", "createdOn": {"from": "2024-01-01"}}``.
+
+        Returns:
+            A dictionary of URL query parameters.
+
+        Raises:
+            ConfigValidationError: If the endpoint cannot filter on a field.
+        """
+        filters = (self.config.get("filters") or {}).get(self.name) or {}
+        params: dict[str, t.Any] = {}
+        for field, value in filters.items():
+            if field not in self.filterable_fields:
+                supported = ", ".join(self.filterable_fields) or "none"
+                msg = (
+                    f"Stream `{self.name}` cannot be filtered on `{field}`, "
+                    f"supported fields: {supported}"
+                )
+                raise ConfigValidationError(msg)
+            bounds = value if isinstance(value, dict) else {None: value}
+            if not bounds or not set(bounds) <= {None, "from", "to"}:
+                msg = f"Filter `{field}` of stream `{self.name}` needs `from` or `to`"
+                raise ConfigValidationError(msg)
+            for bound, bound_value in bounds.items():
+                key = f"query[{field}][{bound}]" if bound else f"query[{field}]"
+                # The API expects lowercase booleans.
+                params[key] = (
+                    str(bound_value).lower()
+                    if isinstance(bound_value, bool)
+                    else bound_value
+                )
+        return params
+
+    def get_date_windows(self, context: dict | None) -> list[dict[str, str]]:
+        """Return the query parameters of each date window to request.
+
+        The range goes from the bookmark, or ``start_date``, to today, and is only
+        split when longer than ``date_window_days``. Without either, a single
+        request without date filter returns the default activity range of the API.
+
+        Args:
+            context: The stream context.
+
+        Returns:
+            A list of URL query parameters, one per date window, in date order.
+        """
+        if not self.date_windowed:
+            return [{}]
+        start_date = self.get_starting_timestamp(context)
+        if not start_date:
+            return [{}]
+        today = datetime.datetime.now(datetime.timezone.utc).date()
+        day = start_date.date()
+        window = datetime.timedelta(days=self.config.get("date_window_days", 7) - 1)
+        windows = []
+        while day <= today:
+            end = min(day + window, today)
+            windows.append(
+                {
+                    f"query[{self.replication_key}][from]": day.strftime(DATE_FORMAT),
+                    f"query[{self.replication_key}][to]": end.strftime(DATE_FORMAT),
+                },
+            )
+            day = end + datetime.timedelta(days=1)
+        return windows
+
+    @property
+    def per_page(self) -> int:
+        """Return the configured number of records per page."""
+        return self.config.get("per_page", 1000)
+
+    @property
+    def adaptive_page_size(self) -> bool:
+        """Return whether the page size adapts to the cost of the responses."""
+        return self.config.get("adaptive_page_size", False)
+
+    @cached_property
+    def page_size_controller(self) -> PageSizeController:
+        """Return the page size controller of the stream, shared by its contexts.
+
+        Returns:
+            A page size controller instance.
+        """
+        return PageSizeController(
+            self.per_page,
+            target_seconds=self.config.get("target_page_seconds", 2.0),
+            target_bytes=self.config.get("target_page_bytes", 1_000_000),
+        )
+
+    @property
+    def max_workers(self) -> int:
+        """Return the number of child contexts fetched concurrently."""
+        return min(self.config.get("max_workers", 1), MAX_CONCURRENT_REQUESTS)
+
+    def _request(
+        self,
+        prepared_request: requests.PreparedRequest,
+        context: dict | None,
+    ) -> requests.Response:
+        """Send the request once the shared rate limiter and a request slot allow it.
+
+        Args:
+            prepared_request: The request to send.
+            context: The stream context.
+
+        Returns:
+            The HTTP response.
+        """
+        if self.async_engine:
+            return self.async_engine.run(self._arequest(prepared_request, context))
+
+        cached = self._add_cache_validators(prepared_request, context)
+        performance = self.tap.performance
+        with performance.timer(self.name, self.path, Phase.THROTTLE):
+            self.tap.get_rate_limiter(context).acquire()
+            # Page prefetch, child workers and partition lookahead share the slots.
+            self.tap.request_slots.acquire()
+        try:
+            with performance.timer(self.name, self.path, Phase.REQUEST):
+                response = self.requests_session.send(
+                    prepared_request,
+                    timeout=self.timeout,
+                    stream=self.stream_responses,
+                )
+                self._check_response(prepared_request, response, context)
+        finally:
+            self.tap.request_slots.release()
+        if self.response_cache:
+            key = self._cache_key(prepared_request, context)
+            self._revalidate(self.response_cache, key, response, cached)
+        return response
+
+    async def _arequest(
+        self,
+        prepared_request: requests.PreparedRequest,
+        context: dict | None,
+    ) -> requests.Response:
+        """Send the request on the async engine once the rate limiter allows it.
+
+        Args:
+            prepared_request: The request to send.
+            context: The stream context.
+
+        Returns:
+            The HTTP response.
+        """
+        cached = self._add_cache_validators(prepared_request, context)
+        performance = self.tap.performance
+        with performance.timer(self.name, self.path, Phase.THROTTLE):
+            await asyncio.sleep(max(self.tap.get_rate_limiter(context).schedule(), 0))
+        engine = t.cast(AsyncEngine, self.async_engine)
+        with performance.timer(self.name, self.path, Phase.REQUEST):
+            response = await engine.send(prepared_request, self.timeout)
+            self._check_response(prepared_request, response, context)
+        if self.response_cache:
+            key = self._cache_key(prepared_request, context)
+            self._revalidate(self.response_cache, key, response, cached)
+        return response
+
+    @property
+    def async_engine(self) -> AsyncEngine | None:
+        """Return the async engine sending the requests, if enabled."""
+        return self.tap.async_engine
+
+    def _check_response(
+        self,
+        prepared_request: requests.PreparedRequest,
+        response: requests.Response,
+        context: dict | None,
+    ) -> None:
+        """Log the request duration, then validate the response.
+
+        Rate limit headers are read before validation so that ``429`` answers
+        refresh the budget too.
+
+        Args:
+            prepared_request: The sent request.
+            response: The HTTP response.
+            context: The stream context.
+        """
+        self._update_rate_limit(response, context)
+        self._write_request_duration_log(
+            endpoint=self.path,
+            response=response,
+            context=context,
+            extra_tags={"url": prepared_request.path_url}
+            if self._LOG_REQUEST_METRIC_URLS
+            else None,
+        )
+        self.validate_response(response)
+
+    @staticmethod
+    def _cache_key(
+        prepared_request: requests.PreparedRequest,
+        context: dict | None,
+    ) -> str:
+        """Return the response cache key of a request.
+
+        Args:
+            prepared_request: The request to send.
+            context: The stream context.
+
+        Returns:
+            The request URL, prefixed with the account ID if any.
+        """
+        account_id = (context or {}).get(ACCOUNT_ID_KEY)
+        url = t.cast(str, prepared_request.url)
+        return f"{account_id}:{url}" if account_id else url
+
+    def _add_cache_validators(
+        self,
+        prepared_request: requests.PreparedRequest,
+        context: dict | None,
+    ) -> CachedResponse | None:
+        """Make the request conditional on the cached response, if any.
+
+        Args:
+            prepared_request: The request to send.
+            context: The stream context.
+
+        Returns:
+            The cached response, or ``None``.
+        """
+        cache = self.response_cache
+        key = self._cache_key(prepared_request, context)
+        cached = cache.get(key) if cache else None
+        if cached:
+            if cached.etag:
+                prepared_request.headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                prepared_request.headers["If-Modified-Since"] = cached.last_modified
+        return cached
+
+    @property
+    def response_cache(self) -> ResponseCache | None:
+        """Return the response cache, if enabled for this stream."""
+        return self.tap.response_cache if self.cacheable else None
+
+    @staticmethod
+    def _revalidate(
+        cache: ResponseCache,
+        key: str,
+        response: requests.Response,
+        cached: CachedResponse | None,
+    ) -> None:
+        """Serve a ``304 Not Modified`` answer from the cache, or cache the response.
+
+        Args:
+            cache: The response cache.
+            key: The cache key of the request.
+            response: The HTTP response.
+            cached: The cached response sent for revalidation, if any.
+        """
+        if response.status_code == HTTPStatus.NOT_MODIFIED and cached:
+            cache.touch(key)
+            response.status_code = HTTPStatus.OK
+            response._content = cached.body  # noqa: SLF001
+            response._content_consumed = True  # type: ignore[attr-defined]  # noqa: SLF001
+            return
+        cache.put(
+            key,
+            response.content,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+        )
+
+    def _update_rate_limit(
+        self,
+        response: requests.Response,
+        context: dict | None,
+    ) -> None:
+        """Feed the rate limit headers to the rate limiter of the context account.
+
+        Args:
+            response: The HTTP response.
+            context: The stream context.
+        """
+        rate_limiter = self.tap.get_rate_limiter(context)
+        rate_limiter.update(response.headers)
+        if rate_limiter.remaining is not None:
+            tags = {
+                metrics.Tag.STREAM: self.name,
+                "limit": rate_limiter.limit,
+                "reset_in": rate_limiter.reset_in,
+            }
+            if context and ACCOUNT_ID_KEY in context:
+                tags[ACCOUNT_ID_KEY] = context[ACCOUNT_ID_KEY]
+            self._log_metric(
+                metrics.Point(
+                    "gauge",
+                    RateLimitMetric.REMAINING,  # type: ignore[arg-type]
+                    rate_limiter.remaining,
+                    tags=tags,
+                ),
+            )
+
+    def request_records(self, context: dict | None) -> t.Iterable[dict]:
+        """Request records, serving them from the prefetch buffer when available.
+
+        Args:
+            context: The stream context.
+
+        Yields:
+            Each record from the source.
+        """
+        key = _context_key(context)
+        if key in self._prefetched_records:
+            yield from self._prefetched_records.pop(key)
+            return
+        if key in self._partition_buffers:
+            yield from self._drain_partition(self._partition_buffers.pop(key))
+            return
+        yield from self._request_context_records(context)
+
+    def _request_context_records(self, context: dict | None) -> t.Iterable[dict]:
+        """Request the records of a context, date window after date window.
+
+        Args:
+            context: The stream context.
+
+        Yields:
+            Each record from the source.
+        """
+        for query in self.get_date_windows(context):
+            yield from self._request_pages(context, query)
+        if self.checkpoints_enabled:
+            self.get_context_state(context).pop("checkpoint", None)
+
+    @property
+    def partition_lookahead(self) -> int:
+        """Return the number of upcoming partitions requested in the background."""
+        return 0
+
+    def _prefetch_partitions(self, context: dict | None) -> None:
+        """Start requesting the partitions following a context in the background.
+
+        Records of the upcoming partitions are buffered until their turn, so that
+        they are still emitted partition after partition. Each buffer holds at most
+        a page of records: a worker waits for its partition to be emitted before
+        requesting the next pages.
+
+        Args:
+            context: The partition being synced.
+        """
+        partitions = self.partitions or []
+        if not self.partition_lookahead or context not in partitions:
+            return
+        index = partitions.index(context)
+        for upcoming in partitions[index + 1 : index + 1 + self.partition_lookahead]:
+            key = _context_key(upcoming)
+            if key in self._partition_buffers:
+                continue
+            # Seed the bookmark the request starts from, as the partition sync would.
+            self._write_starting_replication_value(upcoming)
+            buffer: queue.Queue = queue.Queue(maxsize=self.per_page)
+            # Daemon threads: a worker blocked on a full buffer must not hold the
+            # process at exit if the sync is interrupted.
+            threading.Thread(
+                target=self._fill_partition,
+                args=(upcoming, buffer),
+                daemon=True,
+            ).start()
+            self._partition_buffers[key] = buffer
+
+    def _fill_partition(self, context: dict, buffer: queue.Queue) -> None:
+        """Request the records of a partition into its buffer, then mark its end.
+
+        Args:
+            context: The partition to request.
+            buffer: The bounded buffer the records are put in.
+        """
+        try:
+            for record in self._request_context_records(context):
+                buffer.put(record)
+        except Exception as exc:  # noqa: BLE001
+            buffer.put(exc)
+        else:
+            buffer.put(_END_OF_PARTITION)
+
+    @staticmethod
+    def _drain_partition(buffer: queue.Queue) -> t.Iterable[dict]:
+        """Yield the records of a prefetched partition as they are received.
+
+        Args:
+            buffer: The buffer of the partition.
+
+        Yields:
+            Each record of the partition.
+
+        Raises:
+            Exception: The error the partition request failed with.
+        """
+        while True:
+            item = buffer.get()
+            if item is _END_OF_PARTITION:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+
+    @property
+    def checkpoints_enabled(self) -> bool:
+        """Return whether the last completed page is saved in the stream state.
+
+        Child streams resume with their parent, and sorted incremental streams
+        already resume from their bookmark.
+        """
+        return self.parent_stream_type is None and not (
+            self.replication_key and self.is_sorted
+        )
+
+    def _get_resume_page(
+        self,
+        context: dict | None,
+        query: dict[str, str],
+    ) -> int | None:
+        """Return the page following the checkpoint of an interrupted listing.
+
+        Args:
+            context: The stream context.
+            query: Extra URL query parameters, e.g. a date window.
+
+        Returns:
+            The page to start from, or ``None`` to start from the first page.
+        """
+        if not self.checkpoints_enabled:
+            return None
+        checkpoint = self.get_context_state(context).get("checkpoint")
+        if not checkpoint or checkpoint["query"] != query:
+            return None
+        # The page size may have changed since the checkpoint: resume from the
+        # first record not read yet, when it starts a page.
+        offset = checkpoint["page"] * checkpoint["perPage"]
+        if offset % self.per_page:
+            return None
+        self.logger.info("Resuming '%s' after record %d", self.name, offset)
+        return offset // self.per_page + 1
+
+    def _checkpoint(
+        self,
+        context: dict | None,
+        query: dict[str, str],
+        page: int,
+        per_page: int | None = None,
+    ) -> None:
+        """Save a completed page in the stream state.
+
+        Children of the page records are synced first, so that a resumed run does
+        not skip them.
+
+        Args:
+            context: The stream context.
+            query: Extra URL query parameters, e.g. a date window.
+            page: The completed page.
+            per_page: The page size, if not the configured one.
+        """
+        if not self.checkpoints_enabled:
+            return
+        self.get_context_state(context)["checkpoint"] = {
+            "page": page,
+            "perPage": per_page or self.per_page,
+            "query": query,
+        }
+        self._write_state_message()
+
+    @property
+    def stream_responses(self) -> bool:
+        """Return whether records are parsed while the response body is received."""
+        return self.config.get("stream_responses", False)
+
+    @property
+    def page_prefetch_window(self) -> int:
+        """Return the number of pages requested concurrently after the first one."""
+        return min(
+            self.config.get("page_prefetch_window", 1),
+            MAX_CONCURRENT_REQUESTS,
+        )
+
+    def _request_page(
+        self,
+        context: dict | None,
+        page: int | PageToken,
+        query: dict[str, str],
+        decorated_request: t.Callable[..., requests.Response],
+    ) -> requests.Response:
+        """Request a single page of records.
+
+        Args:
+            context: The stream context.
+            page: The page number, or the page and its size.
+            query: Extra URL query parameters, e.g. a date window.
+            decorated_request: The request function, wrapped with retries.
+
+        Returns:
+            The HTTP response.
+        """
+        prepared_request = self.prepare_request(context, next_page_token=page)
+        if query:
+            prepared_request.prepare_url(prepared_request.url, query)
+        response = decorated_request(prepared_request, context)
+        self.update_sync_costs(prepared_request, response, context)
+        return response
+
+    def _request_pages(
+        self,
+        context: dict | None,
+        query: dict[str, str],
+    ) -> t.Iterable[dict]:
+        """Request all the pages of records for a context.
+
+        The first page is requested alone to read the ``TotalPages`` header. With a
+        prefetch window, the remaining pages are then requested concurrently while
+        records are still yielded in page order.
+
+        Args:
+            context: The stream context.
+            query: Extra URL query parameters, e.g. a date window.
+
+        Yields:
+            Each record from the source.
+        """
+        if self.adaptive_page_size:
+            yield from self._request_adaptive_pages(context, query)
+            return
+
+        paginator = self.get_new_paginator(self._get_resume_page(context, query))
+        decorated_request = self.request_decorator(self._request)
+        window = self.page_prefetch_window
+
+        with metrics.http_request_counter(self.name, self.path) as request_counter:
+            request_counter.context = context
+
+            while not paginator.finished:
+                page = paginator.current_value
+                response = self._request_page(context, page, query, decorated_request)
+                request_counter.increment()
+                yield from self._parse_page(response)
+                self._checkpoint(context, query, page)
+                paginator.advance(response)
+
+                if window > 1 and not paginator.finished:
+                    total_pages = int(response.headers["TotalPages"])
+                    pages = range(paginator.current_value, total_pages + 1)
+                    yield from self._prefetch_pages(
+                        context,
+                        pages,
+                        query,
+                        decorated_request,
+                        request_counter,
+                    )
+                    return
+
+    def _request_adaptive_pages(
+        self,
+        context: dict | None,
+        query: dict[str, str],
+    ) -> t.Iterable[dict]:
+        """Request all the pages of records, adapting the size of each page.
+
+        Pages are requested one at a time, as the size of a page depends on the
+        cost of the previous ones. A page timing out is requested again with a
+        smaller size, before falling back to the regular retries.
+
+        Args:
+            context: The stream context.
+            query: Extra URL query parameters, e.g. a date window.
+
+        Yields:
+            Each record from the source.
+        """
+        controller = self.page_size_controller
+        decorated_request = self.request_decorator(self._request)
+        resume_page = self._get_resume_page(context, query)
+        offset = (resume_page - 1) * self.per_page if resume_page else 0
+
+        with metrics.http_request_counter(self.name, self.path) as request_counter:
+            request_counter.context = context
+
+            while True:
+                per_page = controller.size_for(offset)
+                page = PageToken(offset // per_page + 1, per_page)
+                try:
+                    response = self._request_page(context, page, query, self._request)
+                except (requests.exceptions.RequestException, RetriableAPIError) as exc:
+                    if _is_slow_page_error(exc) and controller.shrink(per_page):
+                        self.logger.info(
+                            "Page of %d '%s' records timed out, shrinking page size",
+                            per_page,
+                            self.name,
+                        )
+                        continue
+                    response = self._request_page(
+                        context,
+                        page,
+                        query,
+                        decorated_request,
+                    )
+                request_counter.increment()
+
+                size = controller.observe(
+                    per_page,
+                    response.elapsed.total_seconds(),
+                    self._response_size(response),
+                )
+                if size != per_page:
+                    self.logger.debug("Page size of '%s' set to %d", self.name, size)
+
+                yield from self._parse_page(response)
+                self._checkpoint(context, query, page.page, per_page)
+                if not self.get_new_paginator().has_more(response):
+                    return
+                offset += per_page
+
+    def _response_size(self, response: requests.Response) -> int:
+        """Return the size of a response body, in bytes.
+
+        Chunked responses have no ``Content-Length`` header: the size of a body
+        read in full is measured instead. Streamed bodies are not read yet, so
+        their header is used, if any.
+
+        Args:
+            response: The HTTP response.
+
+        Returns:
+            The body size, or 0 if unknown.
+        """
+        if self.stream_responses and not self.async_engine:
+            return int(response.headers.get("Content-Length", 0))
+        return len(response.content)
+
+    async def _arequest_page(
+        self,
+        context: dict | None,
+        page: int,
+        query: dict[str, str],
+    ) -> requests.Response:
+        """Request a single page of records on the async engine.
+
+        Args:
+            context: The stream context.
+            page: The page number.
+            query: Extra URL query parameters, e.g. a date window.
+
+        Returns:
+            The HTTP response.
+        """
+        prepared_request = self.prepare_request(context, next_page_token=page)
+        if query:
+            prepared_request.prepare_url(prepared_request.url, query)
+        response = await self.request_decorator(self._arequest)(
+            prepared_request,
+            context,
+        )
+        self.update_sync_costs(prepared_request, response, context)
+        return response
+
+    async def _arequest_records(self, context: dict | None) -> list[dict]:
+        """Request all the records of a context on the async engine.
+
+        Pages of a context are requested one after the other: concurrency comes
+        from the contexts requested together.
+
+        Args:
+            context: The stream context.
+
+        Returns:
+            The records, in page order.
+        """
+        records: list[dict] = []
+        with metrics.http_request_counter(self.name, self.path) as request_counter:
+            request_counter.context = context
+            for query in self.get_date_windows(context):
+                paginator = self.get_new_paginator()
+                while not paginator.finished:
+                    response = await self._arequest_page(
+                        context,
+                        paginator.current_value,
+                        query,
+                    )
+                    request_counter.increment()
+                    records.extend(self._parse_page(response))
+                    paginator.advance(response)
+        return records
+
+    def _prefetch_pages(
+        self,
+        context: dict | None,
+        pages: t.Iterable[int],
+        query: dict[str, str],
+        decorated_request: t.Callable[..., requests.Response],
+        request_counter: metrics.Counter,
+    ) -> t.Iterable[dict]:
+        """Request pages concurrently, at most ``page_prefetch_window`` at a time.
+
+        Pages are requested from worker threads, or as coroutines on the async
+        engine when enabled.
+
+        Args:
+            context: The stream context.
+            pages: The page numbers to request.
+            query: Extra URL query parameters, e.g. a date window.
+            decorated_request: The request function, wrapped with retries.
+            request_counter: The HTTP request counter of the stream.
+
+        Yields:
+            Each record from the source, in page order.
+        """
+        window = self.page_prefetch_window
+        with contextlib.ExitStack() as stack:
+            engine = self.async_engine
+            if engine:
+
+                def submit(page: int) -> Future[requests.Response]:
+                    return engine.submit(self._arequest_page(context, page, query))
+
+            else:
+                executor = stack.enter_context(ThreadPoolExecutor(max_workers=window))
+
+                def submit(page: int) -> Future[requests.Response]:
+                    return executor.submit(
+                        self._request_page,
+                        context,
+                        page,
+                        query,
+                        decorated_request,
+                    )
+
+            futures: deque[tuple[int, Future[requests.Response]]] = deque()
+            for page in pages:
+                futures.append((page, submit(page)))
+                if len(futures) < window:
+                    continue
+                done_page, future = futures.popleft()
+                request_counter.increment()
+                yield from self._parse_page(future.result())
+                self._checkpoint(context, query, done_page)
+            while futures:
+                done_page, future = futures.popleft()
+                request_counter.increment()
+                yield from self._parse_page(future.result())
+                self._checkpoint(context, query, done_page)
+
+    def get_records(self, context: dict | None) -> t.Iterable[dict]:
+        """Return records tagged with their account, then sync buffered children.
+
+        Args:
+            context: The stream context.
+
+        Yields:
+            Each record from the source.
+        """
+        performance = self.tap.performance
+        self._current_context = context
+        self._prefetch_partitions(context)
+        account_id = (context or {}).get(ACCOUNT_ID_KEY)
+        for record in self.request_records(context):
+            with performance.timer(self.name, self.path, Phase.POST_PROCESS):
+                transformed_record = self.post_process(record, context)
+            if transformed_record is None:
+                # Record filtered out during post_process()
+                continue
+            if account_id:
+                transformed_record[ACCOUNT_ID_KEY] = account_id
+            self._current_record = transformed_record
+            yield transformed_record
+        self._flush_child_contexts()
+
+    def _parse_page(self, response: requests.Response) -> t.Iterable[dict]:
+        """Parse a page of records, timing the decoding of each record.
+
+        Args:
+            response: The HTTP response.
+
+        Yields:
+            Each record from the source.
+        """
+        yield from self.tap.performance.timed(
+            self.parse_response(response),
+            self.name,
+            self.path,
+            Phase.DECODE,
+        )
+
+    def _write_record_message(self, record: dict) -> None:
+        """Write out a RECORD message, timing validation and emission.
+
+        With ``fast_emission``, messages are serialized with the fast encoder and
+        stdout is only flushed with the next STATE message.
+
+        Args:
+            record: A single stream record.
+        """
+        performance = self.tap.performance
+        fast_emission = self.fast_emission
+        with performance.timer(self.name, self.path, Phase.VALIDATE):
+            if fast_emission:
+                record_messages = list(self._generate_fast_record_messages(record))
+            else:
+                record_messages = list(self._generate_record_messages(record))
+        with performance.timer(self.name, self.path, Phase.EMIT):
+            for record_message in record_messages:
+                if fast_emission:
+                    sys.stdout.write(format_message(record_message) + "\n")
+                else:
+                    write_message(record_message)
+        self._is_state_flushed = False
+
+    @property
+    def fast_emission(self) -> bool:
+        """Return whether records skip conformance and are sampled for validation."""
+        return self.config.get("fast_emission", False)
+
+    @cached_property
+    def record_validator(self) -> t.Any:  # noqa: ANN401
+        """Return the JSON schema validator of the stream records, compiled once.
+
+        Returns:
+            A ``jsonschema`` validator instance.
+        """
+        validator_class = validator_for(self.schema)
+        return validator_class(self.schema)
+
+    @cached_property
+    def emitted_properties(self) -> frozenset[str]:
+        """Return the top-level properties selected in the catalog.
+
+        Returns:
+            The property names.
+        """
+        return frozenset(
+            name
+            for name in self.schema["properties"]
+            if self.mask.get(("properties", name), True)
+        )
+
+    def _generate_fast_record_messages(
+        self,
+        record: dict,
+    ) -> t.Iterable[RecordMessage]:
+        """Generate the RECORD messages of a record, without type conformance.
+
+        Records parsed from the API JSON already hold JSON types: only top-level
+        properties missing from the schema are dropped. One record out of
+        ``1 / validation_sample_rate`` is validated against the stream schema, and
+        errors are logged.
+
+        Args:
+            record: A single stream record.
+
+        Yields:
+            Record message objects.
+        """
+        properties = self.emitted_properties
+        record = {name: value for name, value in record.items() if name in properties}
+        sample_rate = self.config.get("validation_sample_rate", 0.01)
+        interval = max(round(1 / sample_rate), 1) if sample_rate > 0 else 0
+        if interval and self._emitted_records % interval == 0:
+            error = next(self.record_validator.iter_errors(record), None)
+            if error is not None:
+                self.logger.warning(
+                    "Record of '%s' does not match its schema: %s",
+                    self.name,
+                    error.message,
+                )
+        self._emitted_records += 1
+
+        for stream_map in self.stream_maps:
+            mapped_record = stream_map.transform(record)
+            # Emit record if not filtered
+            if mapped_record is not None:
+                yield RecordMessage(
+                    stream=stream_map.stream_alias,
+                    record=mapped_record,
+                    version=None,
+                    time_extracted=datetime.datetime.now(datetime.timezone.utc),
+                )
+
+    def _hydrate_children(self, child_context: dict) -> None:
+        """Build hydrated child records from the current parent record.
+
+        Children whose selected fields are all part of the parent record get their
+        records from it; the others fall back to their own request. Fields only
+        requested for the children are then removed from the parent record.
+
+        Args:
+            child_context: The context generated for the child streams.
+        """
+        record = self._current_record
+        if record is None:
+            return
+        for child in self.hydrated_children:
+            fields = child.get_selected_fields() or child.api_properties
+            if all(name in record for name in fields):
+                child._prefetched_records[_context_key(child_context)] = [  # noqa: SLF001
+                    {name: record[name] for name in fields},
+                ]
+        for name in set(record) - set(self.schema["properties"]):
+            del record[name]
+
+    def _skip_unchanged_children(self, child_context: dict) -> None:
+        """Skip the children synced for the same version of the current parent record.
+
+        Args:
+            child_context: The context generated for the child streams.
+        """
+        record = self._current_record
+        children = self.fingerprinted_children
+        if record is None or not children:
+            return
+        index = t.cast(FingerprintIndex, self.tap.fingerprint_index)
+        value = self.get_fingerprint(record)
+        changed = []
+        for child in children:
+            if index.get(child.name, child_context) == value:
+                # An empty prefetch buffer makes the child sync emit nothing.
+                child._prefetched_records[_context_key(child_context)] = []  # noqa: SLF001
+            else:
+                changed.append(child.name)
+        if changed:
+            self._pending_fingerprints[_context_key(child_context)] = (value, changed)
+
+    def _skip_frozen_children(self, child_context: dict) -> None:
+        """Skip the children already synced for the current final parent record.
+
+        Children are synced again once ``frozen_refresh_days`` have passed since
+        they were frozen.
+
+        Args:
+            child_context: The context generated for the child streams.
+        """
+        record = self._current_record
+        children = self.frozen_children
+        if record is None or not children or not self.is_final(record):
+            return
+        now = datetime.datetime.now(datetime.timezone.utc)
+        refresh_days = self.config.get("frozen_refresh_days")
+        pending = []
+        for child in children:
+            frozen_at = child.get_context_state(child_context).get("frozen_at")
+            if frozen_at and (
+                refresh_days is None
+                or now - datetime.datetime.fromisoformat(frozen_at)
+                < datetime.timedelta(days=refresh_days)
+            ):
+                child._prefetched_records[_context_key(child_context)] = []  # noqa: SLF001
+            else:
+                pending.append(child)
+        if pending:
+            self._pending_freezes[_context_key(child_context)] = pending
+
+    def _skip_stale_children(self, child_context: dict) -> None:
+        """Skip the children of the current parent record if dated before the horizon.
+
+        Parent records without a date, e.g. newsletters not sent yet, are synced.
+
+        Args:
+            child_context: The context generated for the child streams.
+        """
+        record = self._current_record
+        children = self.stale_children
+        if record is None or not children or not record.get(self.horizon_field):
+            return
+        horizon = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(
+            days=self.config["newsletter_activity_days"],
+        )
+        dated_on = t.cast(datetime.datetime, pendulum.parse(record[self.horizon_field]))
+        if dated_on < horizon:
+            for child in children:
+                child._prefetched_records[_context_key(child_context)] = []  # noqa: SLF001
+
+    def _sync_context_children(self, child_context: dict | None) -> None:
+        """Sync the children of a context, then record their fingerprints and freezes.
+
+        Args:
+            child_context: The context generated for the child streams.
+        """
+        super()._sync_children(child_context)
+        if child_context is None:
+            return
+        key = _context_key(child_context)
+        pending = self._pending_fingerprints.pop(key, None)
+        if pending:
+            value, children = pending
+            index = t.cast(FingerprintIndex, self.tap.fingerprint_index)
+            for name in children:
+                index.put(name, child_context, value)
+        frozen_at = datetime.datetime.now(datetime.timezone.utc).isoformat()
+        for child in self._pending_freezes.pop(key, []):
+            child.get_context_state(child_context)["frozen_at"] = frozen_at
+
+    def _sync_children(self, child_context: dict | None) -> None:
+        """Buffer child contexts so their requests can be dispatched concurrently.
+
+        Child contexts inherit the account of the parent context.
+
+        Args:
+            child_context: The context generated for the child streams.
+        """
+        account_id = (self._current_context or {}).get(ACCOUNT_ID_KEY)
+        if child_context is not None and account_id:
+            child_context = {**child_context, ACCOUNT_ID_KEY: account_id}
+        if child_context is not None:
+            self._hydrate_children(child_context)
+            self._skip_unchanged_children(child_context)
+            self._skip_frozen_children(child_context)
+            self._skip_stale_children(child_context)
+        if self.max_workers <= 1 or child_context is None:
+            self._sync_context_children(child_context)
+            return
+        self._pending_child_contexts.append(child_context)
+        if len(self._pending_child_contexts) >= self.max_workers * CHILD_BATCH_FACTOR:
+            self._flush_child_contexts()
+
+    def _flush_child_contexts(self) -> None:
+        """Fetch buffered child contexts concurrently, then sync them in order.
+
+        Contexts are fetched over a worker pool, or as coroutines on the async
+        engine. Only HTTP requests run concurrently: records are emitted by the
+        regular child sync, parent by parent, so the output order is deterministic.
+        """
+        contexts, self._pending_child_contexts = self._pending_child_contexts, []
+        if not contexts:
+            return
+
+        jobs = [
+            (child, context)
+            for child in self.children
+            if child.selected or child.has_selected_descendents
+            for context in contexts
+            if _context_key(context) not in child._prefetched_records  # noqa: SLF001
+        ]
+        for child, context in jobs:
+            # Seed the bookmarks the workers start from, as the child sync would.
+            child._write_starting_replication_value(context)  # noqa: SLF001
+        if self.async_engine:
+            results = self.async_engine.gather(
+                child._arequest_records(context)  # noqa: SLF001
+                for child, context in jobs
+            )
+            for (child, context), records in zip(jobs, results):
+                child._prefetched_records[_context_key(context)] = records  # noqa: SLF001
+        else:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                for (child, context), records in zip(
+                    jobs,
+                    executor.map(
+                        lambda job: list(job[0].request_records(job[1])),
+                        jobs,
+                    ),
+                ):
+                    child._prefetched_records[_context_key(context)] = records  # noqa: SLF001
+
+        for context in contexts:
+            self._sync_context_children(context)
+
+    def _write_state_message(self) -> None:
+        """Write out a STATE message, once the buffered child contexts are synced.
+
+        Otherwise the bookmark of a parent record could be emitted before its
+        children, and a run interrupted in between would never sync them.
+        """
+        self._flush_child_contexts()
+        super()._write_state_message()
+
     def prepare_request_payload(
         self,
         context: dict | None,  # noqa: ARG002
@@ -138,5 +1558,20 @@ class GetResponseStream(RESTStream):
         Yields:
             Each record from the source.
         """
-        # TODO: Parse response body and return a set of records.
-        yield from extract_jsonpath(self.records_jsonpath, input=response.json())
+        if self.records_jsonpath != "$[*]":
+            yield from extract_jsonpath(self.records_jsonpath, input=response.json())
+        elif self.stream_responses:
+            try:
+                yield from iter_json_records(
+                    response.iter_content(chunk_size=STREAM_CHUNK_SIZE),
+                    encoding=response.encoding or "utf-8",
+                )
+            finally:
+                response.close()
+        else:
+            # Fast path equivalent to the `$[*]` JSONPath expression.
+            payload = response.json()
+            if isinstance(payload, list):
+                yield from payload
+            else:
+                yield payload
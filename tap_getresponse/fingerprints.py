@@ -0,0 +1,100 @@
+"""Persistent index of parent record fingerprints, used to skip unchanged parents."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+import typing as t
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS fingerprints (
+    stream TEXT NOT NULL,
+    context TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    PRIMARY KEY (stream, context)
+)
+"""
+
+
+def fingerprint(values: t.Sequence[t.Any]) -> str:
+    """Return a digest identifying a version of a record.
+
+    Args:
+        values: The values of the fields that change along with the record.
+
+    Returns:
+        A SHA-256 digest of the values.
+    """
+    data = json.dumps(values, sort_keys=True, default=str).encode()
+    return hashlib.sha256(data).hexdigest()
+
+
+class FingerprintIndex:
+    """SQLite index of the parent fingerprints each child stream was synced for.
+
+    Fingerprints are stored per child stream, so that a child stream selected for
+    the first time still syncs all the parents. Writes are committed in batches: an
+    interrupted run only syncs the children of the last parents again.
+    """
+
+    #: Number of fingerprints written per transaction.
+    batch_size = 1000
+
+    def __init__(self, path: str) -> None:
+        """Open or create the index.
+
+        Args:
+            path: The SQLite database path.
+        """
+        self._lock = threading.Lock()
+        self._uncommitted = 0
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute(_SCHEMA)
+
+    @staticmethod
+    def _context_key(context: dict) -> str:
+        return json.dumps(context, sort_keys=True, default=str)
+
+    def get(self, stream: str, context: dict) -> str | None:
+        """Return the parent fingerprint a child context was last synced for.
+
+        Args:
+            stream: The child stream name.
+            context: The child context.
+
+        Returns:
+            The fingerprint, or ``None`` if the context was never synced.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT fingerprint FROM fingerprints WHERE stream = ? AND context = ?",
+                (stream, self._context_key(context)),
+            ).fetchone()
+        return row[0] if row else None
+
+    def put(self, stream: str, context: dict, value: str) -> None:
+        """Record the parent fingerprint a child context was synced for.
+
+        Args:
+            stream: The child stream name.
+            context: The child context.
+            value: The parent fingerprint.
+        """
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO fingerprints VALUES (?, ?, ?)",
+                (stream, self._context_key(context), value),
+            )
+            self._uncommitted += 1
+            if self._uncommitted >= self.batch_size:
+                self._connection.commit()
+                self._uncommitted = 0
+
+    def close(self) -> None:
+        """Commit the pending fingerprints and close the database."""
+        with self._lock:
+            self._connection.commit()
+            self._connection.close()
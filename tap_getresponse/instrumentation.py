@@ -0,0 +1,198 @@
+"""Timing of the sync phases, per stream and endpoint."""
+
+from __future__ import annotations
+
+import contextlib
+import enum
+import tempfile
+import threading
+import time
+import typing as t
+from dataclasses import dataclass
+from pathlib import Path
+
+from singer_sdk import metrics
+
+if t.TYPE_CHECKING:
+    import logging
+
+
+class Phase(str, enum.Enum):
+    """Phases a record goes through, from the HTTP request to the RECORD message.
+
+    ``throttle`` is the time requests wait for the rate limiter.
+    """
+
+    THROTTLE = "throttle"
+    REQUEST = "request"
+    DECODE = "decode"
+    POST_PROCESS = "post_process"
+    VALIDATE = "validate"
+    EMIT = "emit"
+
+
+class PerformanceMetric(str, enum.Enum):
+    """Metrics exposing the time spent in each phase."""
+
+    PHASE_DURATION = "phase_duration"
+
+
+@dataclass
+class PhaseTiming:
+    """Aggregated durations of a phase, in seconds."""
+
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+
+
+class PerformanceStats:
+    """Thread-safe aggregation of phase durations.
+
+    Durations are keyed by stream, endpoint template and phase. They are logged as
+    METRIC messages and can be written as a Prometheus textfile, e.g. for the
+    node_exporter textfile collector.
+    """
+
+    def __init__(self) -> None:
+        """Create empty statistics."""
+        self.timings: dict[tuple[str, str, Phase], PhaseTiming] = {}
+        self._lock = threading.Lock()
+
+    def add(self, stream: str, endpoint: str, phase: Phase, duration: float) -> None:
+        """Add the duration of one occurrence of a phase.
+
+        Args:
+            stream: The stream name.
+            endpoint: The endpoint path template.
+            phase: The phase.
+            duration: The phase duration, in seconds.
+        """
+        key = (stream, endpoint, phase)
+        with self._lock:
+            timing = self.timings.get(key)
+            if timing is None:
+                timing = self.timings[key] = PhaseTiming()
+            timing.count += 1
+            timing.total += duration
+            timing.max = max(timing.max, duration)
+
+    @contextlib.contextmanager
+    def timer(self, stream: str, endpoint: str, phase: Phase) -> t.Iterator[None]:
+        """Time the enclosed block as one occurrence of a phase.
+
+        Args:
+            stream: The stream name.
+            endpoint: The endpoint path template.
+            phase: The phase.
+
+        Yields:
+            Nothing.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(stream, endpoint, phase, time.perf_counter() - start)
+
+    def timed(
+        self,
+        iterable: t.Iterable[t.Any],
+        stream: str,
+        endpoint: str,
+        phase: Phase,
+    ) -> t.Iterator[t.Any]:
+        """Time the production of each item of an iterable.
+
+        Args:
+            iterable: The iterable, e.g. a parsing generator.
+            stream: The stream name.
+            endpoint: The endpoint path template.
+            phase: The phase.
+
+        Yields:
+            Each item of the iterable.
+        """
+        iterator = iter(iterable)
+        while True:
+            start = time.perf_counter()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                self.add(stream, endpoint, phase, time.perf_counter() - start)
+                return
+            self.add(stream, endpoint, phase, time.perf_counter() - start)
+            yield item
+
+    def log(self, logger: logging.Logger) -> None:
+        """Log the aggregated durations as METRIC messages.
+
+        Args:
+            logger: The metrics logger.
+        """
+        with self._lock:
+            timings = dict(self.timings)
+        for (stream, endpoint, phase), timing in sorted(timings.items()):
+            metrics.log(
+                logger,
+                metrics.Point(
+                    "timer",
+                    PerformanceMetric.PHASE_DURATION,  # type: ignore[arg-type]
+                    round(timing.total, 6),
+                    tags={
+                        metrics.Tag.STREAM: stream,
+                        metrics.Tag.ENDPOINT: endpoint,
+                        "phase": phase.value,
+                        "count": timing.count,
+                        "max": round(timing.max, 6),
+                    },
+                ),
+            )
+
+    def to_prometheus(self) -> str:
+        """Return the aggregated durations in the Prometheus text format.
+
+        Returns:
+            The Prometheus exposition text.
+        """
+        with self._lock:
+            timings = dict(self.timings)
+        metric_lines = {
+            "seconds_total": "counter",
+            "count_total": "counter",
+            "max_seconds": "gauge",
+        }
+        lines = []
+        for suffix, metric_type in metric_lines.items():
+            name = f"tap_getresponse_phase_{suffix}"
+            lines.append(f"# TYPE {name} {metric_type}")
+            for (stream, endpoint, phase), timing in sorted(timings.items()):
+                value = {
+                    "seconds_total": timing.total,
+                    "count_total": timing.count,
+                    "max_seconds": timing.max,
+                }[suffix]
+                labels = (
+                    f'stream="{stream}",endpoint="{endpoint}",phase="{phase.value}"'
+                )
+                lines.append(f"{name}{{{labels}}} {value}")
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path: str) -> None:
+        """Write the Prometheus textfile atomically.
+
+        Args:
+            path: The textfile path.
+        """
+        target = Path(path)
+        with tempfile.NamedTemporaryFile(
+            "w",
+            dir=target.absolute().parent,
+            suffix=".tmp",
+            delete=False,
+        ) as textfile:
+            textfile.write(self.to_prometheus())
+        temporary = Path(textfile.name)
+        # Temporary files are only readable by their owner: let the exporter read it.
+        temporary.chmod(0o644)
+        temporary.replace(target)
@@ -0,0 +1,80 @@
+"""Incremental parsing of JSON API responses."""
+
+from __future__ import annotations
+
+import codecs
+import json
+import typing as t
+
+_WHITESPACE = " \t\n\r"
+
+
+def _skip_whitespace(buffer: str, pos: int) -> int:
+    """Return the position of the first non-whitespace character from ``pos``."""
+    while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+        pos += 1
+    return pos
+
+
+def iter_json_records(
+    chunks: t.Iterable[bytes],
+    encoding: str = "utf-8",
+) -> t.Iterator[t.Any]:
+    """Yield the elements of a JSON array as soon as they are fully received.
+
+    A top-level JSON object is yielded as a single record, like the ``$[*]``
+    JSONPath expression does.
+
+    Args:
+        chunks: The raw response body, chunk by chunk.
+        encoding: The response body encoding.
+
+    Yields:
+        Each element of the array.
+
+    Raises:
+        ValueError: If the body is not valid JSON.
+    """
+    chunks = iter(chunks)
+    decoder = json.JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder(encoding)()
+    buffer = ""
+    pos = 0
+    in_array = False
+
+    for chunk in chunks:
+        buffer = buffer[pos:] + text_decoder.decode(chunk)
+        pos = 0
+        while True:
+            pos = _skip_whitespace(buffer, pos)
+            if pos == len(buffer):
+                break
+            if not in_array:
+                if buffer[pos] != "[":
+                    # Not an array: the body is a single record.
+                    rest = buffer[pos:] + "".join(
+                        text_decoder.decode(chunk) for chunk in chunks
+                    )
+                    yield json.loads(rest + text_decoder.decode(b"", final=True))
+                    return
+                in_array = True
+                pos += 1
+                continue
+            if buffer[pos] == ",":
+                pos += 1
+                continue
+            if buffer[pos] == "]":
+                return
+            try:
+                record, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                # The element is not fully received yet.
+                break
+            if end == len(buffer) and not isinstance(record, (dict, list)):
+                # A scalar may continue in the next chunk, e.g. a number.
+                break
+            pos = end
+            yield record
+
+    msg = "Unexpected end of JSON array"
+    raise ValueError(msg)
@@ -0,0 +1,106 @@
+"""Page size adapted to the observed response time and size of each endpoint."""
+
+from __future__ import annotations
+
+import threading
+
+# Largest ``perPage`` value accepted by the API.
+MAX_PER_PAGE = 1000
+
+
+class PageSizeController:
+    """Pick the ``perPage`` value of the next page from the previous responses.
+
+    The page size is halved when a page exceeds the response time or byte budget,
+    or times out, and doubled when a page costs less than half of both budgets.
+
+    Listings are paginated by page number, so a listing may only switch to a size
+    that divides the number of records already read. Sizes are therefore taken
+    from a ladder where each size divides the next one, e.g. 125, 250, 500, 1000.
+    """
+
+    def __init__(
+        self,
+        initial: int,
+        target_seconds: float = 2.0,
+        target_bytes: int = 1_000_000,
+        minimum: int = 10,
+        maximum: int = MAX_PER_PAGE,
+    ) -> None:
+        """Create a new page size controller.
+
+        Args:
+            initial: The page size to start with.
+            target_seconds: The response time budget of a page, in seconds.
+            target_bytes: The response size budget of a page, in bytes.
+            minimum: The smallest page size to shrink to.
+            maximum: The largest page size to grow to.
+        """
+        self.target_seconds = target_seconds
+        self.target_bytes = target_bytes
+        sizes = [initial]
+        while sizes[0] % 2 == 0 and sizes[0] // 2 >= minimum:
+            sizes.insert(0, sizes[0] // 2)
+        while sizes[-1] * 2 <= maximum:
+            sizes.append(sizes[-1] * 2)
+        self.sizes = sizes
+        self._index = sizes.index(initial)
+        self._lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        """Return the current target page size."""
+        return self.sizes[self._index]
+
+    def size_for(self, offset: int) -> int:
+        """Return the largest page size usable after ``offset`` records of a listing.
+
+        Args:
+            offset: The number of records of the listing already read.
+
+        Returns:
+            The page size of the next page.
+        """
+        for size in reversed(self.sizes[: self._index + 1]):
+            if offset % size == 0:
+                return size
+        return self.sizes[0]
+
+    def observe(self, size: int, seconds: float, nbytes: int) -> int:
+        """Adapt the page size to the cost of a page.
+
+        Args:
+            size: The page size of the request.
+            seconds: The response time of the request.
+            nbytes: The response body size, in bytes.
+
+        Returns:
+            The new target page size.
+        """
+        index = self.sizes.index(size)
+        with self._lock:
+            if seconds > self.target_seconds or nbytes > self.target_bytes:
+                self._index = max(index - 1, 0)
+            elif (
+                seconds < self.target_seconds / 2
+                and nbytes < self.target_bytes / 2
+                and index >= self._index
+            ):
+                self._index = min(index + 1, len(self.sizes) - 1)
+            return self.size
+
+    def shrink(self, size: int) -> bool:
+        """Halve the page size after a request timed out.
+
+        Args:
+            size: The page size of the request.
+
+        Returns:
+            Whether a smaller page size is available.
+        """
+        index = self.sizes.index(size)
+        with self._lock:
+            if index == 0:
+                return False
+            self._index = min(self._index, index - 1)
+            return True
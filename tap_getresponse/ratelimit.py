@@ -0,0 +1,97 @@
+"""Request pacing driven by the GetResponse ``X-RateLimit-*`` response headers."""
+
+from __future__ import annotations
+
+import enum
+import threading
+import time
+import typing as t
+
+
+class RateLimitMetric(str, enum.Enum):
+    """Metrics exposing the rate limit budget observed from the API."""
+
+    REMAINING = "rate_limit_remaining"
+
+
+def _parse_seconds(value: str) -> float:
+    """Parse a ``X-RateLimit-Reset`` value such as ``"572 seconds"``."""
+    return float(value.split()[0])
+
+
+class RateLimiter:
+    """Token bucket shared by all the streams of a tap.
+
+    The bucket is refilled from the ``X-RateLimit-Limit``, ``X-RateLimit-Remaining``
+    and ``X-RateLimit-Reset`` headers of every response. Requests are spread evenly
+    over the time left before the quota resets, keeping ``reserve`` calls aside, so
+    the sync never runs into ``429 Too Many Requests`` answers.
+
+    Source: https://apireference.getresponse.com/#section/Limits
+    """
+
+    def __init__(self, reserve: int = 10) -> None:
+        """Create a new rate limiter.
+
+        Args:
+            reserve: Number of calls of the quota left untouched.
+        """
+        self.reserve = reserve
+        self.limit: int | None = None
+        self.remaining: int | None = None
+        self._reset_at: float | None = None
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def reset_in(self) -> float | None:
+        """Return the number of seconds before the quota is reset."""
+        if self._reset_at is None:
+            return None
+        return max(self._reset_at - time.monotonic(), 0.0)
+
+    def acquire(self) -> None:
+        """Block until a request can be sent without exceeding the quota."""
+        delay = self.schedule()
+        if delay > 0:
+            time.sleep(delay)
+
+    def schedule(self) -> float:
+        """Book a slot for a request, without waiting for it.
+
+        Returns:
+            The number of seconds to wait before sending the request.
+        """
+        with self._lock:
+            now = time.monotonic()
+            if self._reset_at is not None and now >= self._reset_at:
+                # The quota window is over, trust the limit until the next response.
+                self.remaining = self.limit
+                self._reset_at = None
+            if self.remaining is None or self._reset_at is None:
+                return 0.0
+
+            budget = self.remaining - self.reserve
+            if budget <= 0:
+                slot = self._reset_at
+            else:
+                slot = max(now, self._next_slot)
+                self._next_slot = slot + (self._reset_at - now) / budget
+            self.remaining -= 1
+        return slot - now
+
+    def update(self, headers: t.Mapping[str, str]) -> None:
+        """Refresh the bucket from the rate limit headers of a response.
+
+        Args:
+            headers: The HTTP response headers.
+        """
+        if "X-RateLimit-Remaining" not in headers:
+            return
+        with self._lock:
+            self.remaining = int(headers["X-RateLimit-Remaining"])
+            if "X-RateLimit-Limit" in headers:
+                self.limit = int(headers["X-RateLimit-Limit"])
+            if "X-RateLimit-Reset" in headers:
+                reset = _parse_seconds(headers["X-RateLimit-Reset"])
+                self._reset_at = time.monotonic() + reset
@@ -0,0 +1,36 @@
+"""Fast serialization of Singer messages, with orjson when it is installed."""
+
+from __future__ import annotations
+
+import decimal
+import json
+import typing as t
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+if t.TYPE_CHECKING:
+    from singer_sdk._singerlib import Message
+
+
+def _default(value: t.Any) -> t.Any:  # noqa: ANN401
+    """Serialize the values the JSON encoders do not support natively."""
+    if isinstance(value, decimal.Decimal):
+        return float(value)
+    return str(value)
+
+
+def format_message(message: Message) -> str:
+    """Format a message as a compact JSON line.
+
+    Args:
+        message: The message to format.
+
+    Returns:
+        The JSON line, without its trailing newline.
+    """
+    if orjson is not None:
+        return orjson.dumps(message.to_dict(), default=_default).decode()
+    return json.dumps(message.to_dict(), default=_default, separators=(",", ":"))
@@ -1,4 +1,9 @@
-from tap_getresponse.streams.campaigns import CampaignDetailsStream, CampaignsStream
+from tap_getresponse.streams.campaigns import (
+    CampaignContactsStream,
+    CampaignDetailsStream,
+    CampaignsStream,
+    CampaignStatisticsSummaryStream,
+)
 from tap_getresponse.streams.contacts import (
     ContactActivitiesStream,
     ContactDetailsStream,
@@ -8,6 +13,7 @@ from tap_getresponse.streams.newsletters import (
     NewsletterActivitiesStream,
     NewsletterDetailsStream,
     NewslettersStream,
+    NewsletterStatisticsStream,
 )
 from tap_getresponse.streams.sms import SmsStream
 from tap_getresponse.streams.webinars import WebinarsStream
@@ -1,8 +1,10 @@
 import typing as t
+from itertools import islice
 
 from singer_sdk import typing as th
 
 from tap_getresponse.client import GetResponseStream
+from tap_getresponse.streams.contacts import ContactsStream
 
 
 class CampaignsStream(GetResponseStream):
@@ -11,6 +13,7 @@ class CampaignsStream(GetResponseStream):
     name = "campaigns"
     path = "/campaigns"
     primary_keys: t.ClassVar[list[str]] = ["campaignId"]
+    filterable_fields: t.ClassVar[list[str]] = ["name", "isDefault"]
     schema = th.PropertiesList(
         th.Property(
             "description",
@@ -61,6 +64,144 @@ class CampaignsStream(GetResponseStream):
             "campaignId": record["campaignId"],
         }
 
+    def post_process(
+        self,
+        row: dict,
+        context: t.Optional[dict] = None,  # noqa: ARG002
+    ) -> t.Union[dict, None]:
+        """Skip the campaigns missing from the ``campaign_ids`` setting, if set.
+
+        Args:
+            row: An individual record from the stream.
+            context: The stream context.
+
+        Returns:
+            The record, or ``None`` to skip the campaign and its children.
+        """
+        campaign_ids = self.config.get("campaign_ids")
+        if campaign_ids and row["campaignId"] not in campaign_ids:
+            return None
+        return row
+
+    def get_campaign_ids(self, context: t.Optional[dict]) -> t.List[str]:
+        """Return the IDs of the campaigns of an account, read from the listing.
+
+        Args:
+            context: The account context, if any.
+
+        Returns:
+            The campaign IDs.
+        """
+        decorated_request = self.request_decorator(self._request)
+        paginator = self.get_new_paginator()
+        campaign_ids: t.List[str] = []
+        while not paginator.finished:
+            response = self._request_page(
+                context,
+                paginator.current_value,
+                {},
+                decorated_request,
+            )
+            campaign_ids.extend(
+                record["campaignId"] for record in self.parse_response(response)
+            )
+            paginator.advance(response)
+        return campaign_ids
+
+
+class CampaignStatisticsSummaryStream(GetResponseStream):
+    """Get the summary statistics of campaigns, many campaigns per request.
+
+    See: https://apireference.getresponse.com/#operation/getCampaignStatisticsSummary
+    """
+
+    name = "campaign_statistics_summary"
+    path = "/campaigns/statistics/summary"
+
+    #: Number of campaign IDs sent per request.
+    batch_size = 100
+
+    # The endpoint returns fixed columns and does not accept `fields`.
+    field_selection = False
+
+    primary_keys: t.ClassVar[list[str]] = ["campaignId"]
+
+    schema = th.PropertiesList(
+        th.Property("campaignId", th.StringType, required=True),
+        th.Property(
+            "totalSubscribers",
+            th.IntegerType,
+            description="The number of contacts of the campaign",
+        ),
+        th.Property(
+            "totalNewsletters",
+            th.IntegerType,
+            description="The number of newsletters sent from the campaign",
+        ),
+        th.Property(
+            "totalTriggers",
+            th.IntegerType,
+            description="The number of autoresponders of the campaign",
+        ),
+        th.Property(
+            "totalLandingPages",
+            th.IntegerType,
+            description="The number of landing pages of the campaign",
+        ),
+        th.Property(
+            "totalWebforms",
+            th.IntegerType,
+            description="The number of forms of the campaign",
+        ),
+    ).to_dict()  # type: ignore
+
+    @property
+    def checkpoints_enabled(self) -> bool:
+        """Return ``False``: a batch is a single page, there is nothing to resume."""
+        return False
+
+    def _request_context_records(self, context: t.Optional[dict]) -> t.Iterable[dict]:
+        """Request the statistics of the campaigns, ``batch_size`` IDs at a time.
+
+        The campaigns of the ``campaign_ids`` setting are used when set, otherwise
+        all the campaigns of the account.
+
+        Args:
+            context: The stream context.
+
+        Yields:
+            Each record from the source.
+        """
+        campaign_ids = iter(
+            self.config.get("campaign_ids")
+            or t.cast(CampaignsStream, self.tap.streams["campaigns"]).get_campaign_ids(
+                context,
+            ),
+        )
+        while True:
+            batch = list(islice(campaign_ids, self.batch_size))
+            if not batch:
+                return
+            yield from self._request_pages(
+                context,
+                {"query[campaignId]": ",".join(batch)},
+            )
+
+
+class CampaignContactsStream(GetResponseStream):
+    """Get the contacts of a campaign (list)"""
+
+    name = "campaign_contacts"
+    path = "/campaigns/{campaignId}/contacts"
+
+    parent_stream_type = CampaignsStream
+
+    primary_keys: t.ClassVar[list[str]] = ["contactId"]
+
+    filterable_fields: t.ClassVar[list[str]] = ["email", "name", "origin", "createdOn"]
+
+    schema = ContactsStream.schema
+
 
 class CampaignDetailsStream(GetResponseStream):
     """Get a single campaign by the campaign ID"""
@@ -70,6 +211,8 @@ class CampaignDetailsStream(GetResponseStream):
 
     parent_stream_type = CampaignsStream
 
+    cacheable = True
+
     primary_keys: t.ClassVar[list[str]] = ["campaignId"]
 
     schema = th.PropertiesList(
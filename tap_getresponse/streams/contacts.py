@@ -1,8 +1,22 @@
+import datetime
 import typing as t
+from functools import cached_property
 
+import pendulum
 from singer_sdk import typing as th
 
-from tap_getresponse.client import GetResponseStream
+from tap_getresponse.client import ACCOUNT_ID_KEY, DATE_FORMAT, GetResponseStream
+
+if t.TYPE_CHECKING:
+    from tap_getresponse.streams.campaigns import CampaignsStream
+
+# `createdOn` ranges are aligned on multiples of `contacts_partition_days` from this
+# date, so that partitions, and their bookmarks, stay the same from run to run.
+PARTITION_EPOCH = datetime.date(1970, 1, 1)
+
+# First day of the `createdOn` ranges without `start_date`. Older contacts fall in
+# the first, open-ended partition.
+DEFAULT_PARTITION_START = datetime.date(2015, 1, 1)
 
 
 class ContactsStream(GetResponseStream):
@@ -11,6 +25,21 @@ class ContactsStream(GetResponseStream):
     name = "contacts"
     path = "/contacts"
     primary_keys: t.ClassVar[list[str]] = ["contactId"]
+    replication_key = "changedOn"
+    # Contacts are requested sorted by `changedOn`, so an interrupted sync resumes
+    # from its bookmark. The API filters by day: records of the bookmark day come
+    # before the bookmark.
+    is_sorted = True
+    check_sorted = False
+    fingerprint_fields: t.ClassVar[list[str]] = ["changedOn"]
+    # `changedOn` is left out: it is filtered on with the bookmark.
+    filterable_fields: t.ClassVar[list[str]] = [
+        "email",
+        "name",
+        "origin",
+        "campaignId",
+        "createdOn",
+    ]
     schema = th.PropertiesList(
         th.Property(
             "contactId",
@@ -88,6 +117,116 @@ class ContactsStream(GetResponseStream):
             "contactId": record["contactId"],
         }
 
+    @property
+    def partitioning(self) -> t.Optional[str]:
+        """Return how the listing is split: by ``campaign``, ``created_on`` or not."""
+        return self.config.get("contacts_partitioning")
+
+    @property
+    def partition_lookahead(self) -> int:
+        """Return the number of upcoming partitions requested in the background."""
+        return self.max_workers - 1 if self.partitioning else 0
+
+    @cached_property
+    def _partitions(self) -> t.Optional[t.List[dict]]:
+        if not self.partitioning:
+            return None
+        partitions: t.List[dict] = []
+        accounts = self.tap.accounts
+        contexts = [{ACCOUNT_ID_KEY: account_id} for account_id in accounts] or [{}]
+        for context in contexts:
+            if self.partitioning == "campaign":
+                partitions.extend(
+                    {**context, "campaignId": campaign_id}
+                    for campaign_id in self.get_campaign_ids(context or None)
+                )
+            else:
+                partitions.extend(
+                    {**context, **date_range} for date_range in self.get_date_ranges()
+                )
+        return partitions
+
+    @property
+    def partitions(self) -> t.Optional[t.List[dict]]:
+        """Return the partitions of the listing, each with its own bookmark.
+
+        Returns:
+            One context per campaign or per ``createdOn`` range (and per account),
+            or the default partitions when the listing is not split.
+        """
+        return self._partitions or super().partitions
+
+    def get_campaign_ids(self, context: t.Optional[dict]) -> t.List[str]:
+        """Return the IDs of the campaigns of an account.
+
+        Args:
+            context: The account context, if any.
+
+        Returns:
+            The campaign IDs.
+        """
+        campaigns = t.cast("CampaignsStream", self.tap.streams["campaigns"])
+        return campaigns.get_campaign_ids(context)
+
+    def get_date_ranges(self) -> t.List[dict]:
+        """Return the ``createdOn`` ranges of the partitions, in date order.
+
+        Ranges of ``contacts_partition_days`` days, aligned on multiples of that
+        length since 1970-01-01, go from ``start_date`` to the range of today. The
+        first range is open-ended, so that older contacts are synced too. Ranges
+        only depend on the settings and on the current range: the contexts of past
+        runs, and their bookmarks, are found again.
+
+        Returns:
+            A list of partition contexts.
+        """
+        today = datetime.datetime.now(datetime.timezone.utc).date()
+        start_date = self.config.get("start_date")
+        start = (
+            t.cast(datetime.datetime, pendulum.parse(start_date)).date()
+            if start_date
+            else DEFAULT_PARTITION_START
+        )
+        days = self.config.get("contacts_partition_days", 90)
+        offset = (start.toordinal() - PARTITION_EPOCH.toordinal()) // days * days
+        day = PARTITION_EPOCH + datetime.timedelta(days=offset)
+        before = day - datetime.timedelta(days=1)
+        ranges = [{"createdOnTo": before.strftime(DATE_FORMAT)}]
+        while day <= today:
+            end = day + datetime.timedelta(days=days - 1)
+            ranges.append(
+                {
+                    "createdOnFrom": day.strftime(DATE_FORMAT),
+                    "createdOnTo": end.strftime(DATE_FORMAT),
+                },
+            )
+            day = end + datetime.timedelta(days=1)
+        return ranges
+
+    def get_url_params(
+        self,
+        context: t.Optional[dict],
+        next_page_token: t.Optional[t.Any],  # noqa: ANN401
+    ) -> t.Dict[str, t.Any]:
+        """Return the URL parameters, filtered on the partition of the context.
+
+        Args:
+            context: The stream context.
+            next_page_token: The next page index or value.
+
+        Returns:
+            A dictionary of URL query parameters.
+        """
+        params = super().get_url_params(context, next_page_token)
+        context = context or {}
+        if "campaignId" in context:
+            params["query[campaignId]"] = context["campaignId"]
+        if "createdOnFrom" in context:
+            params["query[createdOn][from]"] = context["createdOnFrom"]
+        if "createdOnTo" in context:
+            params["query[createdOn][to]"] = context["createdOnTo"]
+        return params
+
 
 class ContactDetailsStream(GetResponseStream):
     """Get contact details by contact ID"""
@@ -97,6 +236,14 @@ class ContactDetailsStream(GetResponseStream):
 
     parent_stream_type = ContactsStream
 
+    hydrate_from_parent = True
+    hydration_params: t.ClassVar[dict[str, str]] = {
+        "additionalFlags": "forceCustomFields",
+    }
+
+    cacheable = True
+    skip_unchanged_parents = True
+
     primary_keys: t.ClassVar[list[str]] = ["contactId"]
 
     schema = th.PropertiesList(
@@ -203,8 +350,8 @@ class ContactActivitiesStream(GetResponseStream):
     """
     Get a list of contact activities
 
-    By default, only activities from the last 14 days are returned.
-    TODO: To get earlier data, use `query[createdOn]` parameter from config file.
+    By default, only activities from the last 14 days are returned by the API.
+    Earlier activities are requested from `start_date`, in `date_window_days` slices.
 
     Source: https://apireference.getresponse.com/#operation/getActivities
     """
@@ -213,6 +360,17 @@ class ContactActivitiesStream(GetResponseStream):
     path = "/contacts/{contactId}/activities"
 
     parent_stream_type = ContactsStream
+    # New activity does not change the `changedOn` date of a contact.
+    requires_all_parents = True
+
+    replication_key = "createdOn"
+    date_windowed = True
+    # Windows are requested in date order, each sorted by `createdOn`.
+    is_sorted = True
+    check_sorted = False
+
+    # `contactId` is added from the context and is not a field of the endpoint.
+    field_selection = False
 
     primary_keys: t.ClassVar[list[str]] = ["contactId"]
 
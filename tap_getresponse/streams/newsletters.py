@@ -11,6 +11,19 @@ class NewslettersStream(GetResponseStream):
     name = "newsletters"
     path = "/newsletters"
     primary_keys: t.ClassVar[list[str]] = ["newsletterId"]
+    # Newsletters change status when scheduled or sent, and metrics while sending.
+    fingerprint_fields: t.ClassVar[list[str]] = ["status", "sendMetrics"]
+    final_fields: t.ClassVar[list[str]] = ["sendMetrics"]
+    horizon_field = "sendOn"
+    filterable_fields: t.ClassVar[list[str]] = [
+        "subject",
+        "name",
+        "status",
+        "type",
+        "campaignId",
+        "createdOn",
+        "sendOn",
+    ]
 
     schema = th.PropertiesList(
         th.Property(
@@ -120,6 +133,10 @@ class NewslettersStream(GetResponseStream):
             "newsletterId": record["newsletterId"],
         }
 
+    def is_final(self, record: dict) -> bool:
+        """Return whether the newsletter is sent, so its content won't change."""
+        return (record.get("sendMetrics") or {}).get("status") == "finished"
+
 
 class NewsletterDetailsStream(GetResponseStream):
     """Get a single newsletter by its ID"""
@@ -129,6 +146,10 @@ class NewsletterDetailsStream(GetResponseStream):
 
     parent_stream_type = NewslettersStream
 
+    cacheable = True
+    skip_unchanged_parents = True
+    freeze_final_parents = True
+
     primary_keys: t.ClassVar[list[str]] = ["newsletterId"]
 
     schema = th.PropertiesList(
@@ -315,7 +336,10 @@ class NewsletterActivitiesStream(GetResponseStream):
     """
     Get newsletter activities.
 
-    By default, activities from the last 14 days are listed only.
+    By default, activities from the last 14 days are listed only by the API.
+    Earlier activities are requested from `start_date`, in `date_window_days` slices.
+    With `newsletter_activity_days`, newsletters sent before that many days ago
+    are skipped.
     """
 
     name = "newsletter_activities"
@@ -323,7 +347,27 @@ class NewsletterActivitiesStream(GetResponseStream):
 
     parent_stream_type = NewslettersStream
 
+    replication_key = "createdOn"
+    date_windowed = True
+    # Windows are requested in date order, each sorted by `createdOn`.
+    is_sorted = True
+    check_sorted = False
+    skip_stale_parents = True
+
+    # `newsletterId` is added from the context and is not a field of the endpoint.
+    field_selection = False
+
+    # A newsletter has many activities: one per contact, type and time.
+    primary_keys: t.ClassVar[list[str]] = [
+        "newsletterId",
+        "contactId",
+        "activity",
+        "createdOn",
+    ]
+
     schema = th.PropertiesList(
+        th.Property("newsletterId", th.StringType, required=True),
+        th.Property("contactId", th.StringType, description="The contact ID"),
         th.Property(
             "activity",
             th.StringType,
@@ -345,3 +389,97 @@ class NewsletterActivitiesStream(GetResponseStream):
             ),
         ),
     ).to_dict()  # type: ignore
+
+    def post_process(
+        self,
+        row: dict,
+        context: t.Optional[dict] = None,
+    ) -> t.Union[dict, None]:
+        """Add the newsletter ID, missing from the activities, and the contact ID.
+
+        Args:
+            row: An individual record from the stream.
+            context: The stream context.
+
+        Returns:
+            The updated record dictionary.
+        """
+        row["newsletterId"] = t.cast(dict, context)["newsletterId"]
+        row["contactId"] = (row.get("contact") or {}).get("contactId")
+        return row
+
+
+class NewsletterStatisticsStream(GetResponseStream):
+    """Get the total statistics of a newsletter.
+
+    ``/newsletters/statistics`` accepts many newsletter IDs, but sums their
+    statistics into a single series: per-newsletter totals are requested from
+    ``/newsletters/{newsletterId}/statistics``, one row per newsletter.
+
+    See: https://apireference.getresponse.com/#operation/getSingleNewsletterStatistics
+    """
+
+    name = "newsletter_statistics"
+    path = "/newsletters/{newsletterId}/statistics"
+
+    parent_stream_type = NewslettersStream
+
+    # `newsletterId` is added from the context and is not a field of the endpoint.
+    field_selection = False
+
+    primary_keys: t.ClassVar[list[str]] = ["newsletterId"]
+
+    schema = th.PropertiesList(
+        th.Property("newsletterId", th.StringType, required=True),
+        th.Property(
+            "timeInterval",
+            th.StringType,
+            description="The time range of the statistics",
+        ),
+        th.Property("sent", th.IntegerType, description="Messages sent"),
+        th.Property("totalOpened", th.IntegerType, description="Opens"),
+        th.Property("uniqueOpened", th.IntegerType, description="Unique opens"),
+        th.Property("totalClicked", th.IntegerType, description="Clicks"),
+        th.Property("uniqueClicked", th.IntegerType, description="Unique clicks"),
+        th.Property("goals", th.IntegerType, description="Goals reached"),
+        th.Property("uniqueGoals", th.IntegerType, description="Unique goals"),
+        th.Property("forwarded", th.IntegerType, description="Forwards"),
+        th.Property("unsubscribed", th.IntegerType, description="Unsubscriptions"),
+        th.Property("bounced", th.IntegerType, description="Bounces"),
+        th.Property("complaints", th.IntegerType, description="Spam complaints"),
+    ).to_dict()  # type: ignore
+
+    def get_url_params(
+        self,
+        context: t.Optional[dict],
+        next_page_token: t.Optional[t.Any],  # noqa: ANN401
+    ) -> t.Dict[str, t.Any]:
+        """Return the URL parameters, requesting the totals of the newsletter.
+
+        Args:
+            context: The stream context.
+            next_page_token: The next page index or value.
+
+        Returns:
+            A dictionary of URL query parameters.
+        """
+        params = super().get_url_params(context, next_page_token)
+        params["groupBy"] = "total"
+        return params
+
+    def post_process(
+        self,
+        row: dict,
+        context: t.Optional[dict] = None,
+    ) -> t.Union[dict, None]:
+        """Add the newsletter ID, missing from the statistics.
+
+        Args:
+            row: An individual record from the stream.
+            context: The stream context.
+
+        Returns:
+            The updated record dictionary.
+        """
+        row["newsletterId"] = t.cast(dict, context)["newsletterId"]
+        return row
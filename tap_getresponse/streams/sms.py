@@ -14,6 +14,13 @@ class SmsStream(GetResponseStream):
     name = "sms"
     path = "/sms"
     primary_keys: t.ClassVar[list[str]] = ["smsId"]
+    filterable_fields: t.ClassVar[list[str]] = [
+        "name",
+        "type",
+        "status",
+        "createdOn",
+        "sendOn",
+    ]
     schema = th.PropertiesList(
         th.Property(
             "smsId", th.StringType, required=True, description="The SMS message ID"
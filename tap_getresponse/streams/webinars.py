@@ -11,6 +11,7 @@ class WebinarsStream(GetResponseStream):
     name = "webinars"
     path = "/webinars"
     primary_keys: t.ClassVar[list[str]] = ["webinarId"]
+    filterable_fields: t.ClassVar[list[str]] = ["name", "status", "type", "campaignId"]
     schema = th.PropertiesList(
         th.Property(
             "webinarId",
@@ -2,11 +2,55 @@
 
 from __future__ import annotations
 
+import threading
+import typing as t
+import weakref
+from functools import cached_property
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
 from singer_sdk import Tap
 from singer_sdk import typing as th  # JSON schema typing helpers
+from singer_sdk.authenticators import APIKeyAuthenticator
+from singer_sdk.exceptions import ConfigValidationError
 
 from tap_getresponse import streams
-from tap_getresponse.client import GetResponseStream
+from tap_getresponse.aio import AsyncEngine
+from tap_getresponse.cache import ResponseCache
+from tap_getresponse.client import (
+    ACCOUNT_ID_KEY,
+    DEFAULT_BASE_URL,
+    MAX_CONCURRENT_REQUESTS,
+    GetResponseStream,
+)
+from tap_getresponse.fingerprints import FingerprintIndex
+from tap_getresponse.instrumentation import PerformanceStats
+from tap_getresponse.ratelimit import RateLimiter
+
+if t.TYPE_CHECKING:
+    import logging
+
+
+def _export_performance(
+    performance: PerformanceStats,
+    logger: logging.Logger,
+    textfile: str | None,
+) -> None:
+    """Log the time spent in each sync phase, and write it to a Prometheus file."""
+    performance.log(logger)
+    if textfile:
+        performance.write_prometheus(textfile)
+
+
+def _close_response_cache(cache: ResponseCache, logger: logging.Logger) -> None:
+    """Log the cache hits and close the response cache."""
+    logger.info(
+        "Response cache: %d not modified, %d downloaded",
+        cache.hits,
+        cache.misses,
+    )
+    cache.close()
 
 
 class TapGetResponse(Tap):
@@ -14,34 +58,533 @@ class TapGetResponse(Tap):
 
     name = "tap-getresponse"
 
+    _authenticator: APIKeyAuthenticator | None = None
+
     config_jsonschema = th.PropertiesList(
         th.Property(
             "auth_token",
             th.StringType,
-            required=True,
             secret=True,  # Flag config as protected.
-            description="The token to authenticate against the API service",
+            description=(
+                "The token to authenticate against the API service, "
+                "required unless `accounts` is set"
+            ),
+        ),
+        th.Property(
+            "accounts",
+            th.ArrayType(
+                th.ObjectType(
+                    th.Property(
+                        "account_id",
+                        th.StringType,
+                        required=True,
+                        description="Identifier added to the records of the account",
+                    ),
+                    th.Property(
+                        "auth_token",
+                        th.StringType,
+                        required=True,
+                        secret=True,
+                        description="The token of the account",
+                    ),
+                    th.Property(
+                        "base_url",
+                        th.StringType,
+                        description="The API URL root of the account",
+                    ),
+                    th.Property(
+                        "domain",
+                        th.StringType,
+                        description="The domain of the account, for GetResponse MAX",
+                    ),
+                ),
+            ),
+            description=(
+                "Several accounts to sync in a single run, instead of `auth_token`"
+            ),
+        ),
+        th.Property(
+            "base_url",
+            th.StringType,
+            default=DEFAULT_BASE_URL,
+            description=(
+                "The API URL root, e.g. `https://api.getresponse.com/v3`, "
+                "`https://api3.getresponse360.com/v3` or "
+                "`https://api3.getresponse360.pl/v3`"
+            ),
+        ),
+        th.Property(
+            "domain",
+            th.StringType,
+            description=(
+                "The account domain sent as `X-Domain` header, "
+                "required by GetResponse MAX (360) accounts"
+            ),
+        ),
+        th.Property(
+            "start_date",
+            th.DateTimeType,
+            description="The earliest record date to sync for incremental streams",
+        ),
+        th.Property(
+            "date_window_days",
+            th.IntegerType,
+            default=7,
+            description="Number of days of activity requested at once",
+        ),
+        th.Property(
+            "max_workers",
+            th.IntegerType,
+            default=1,
+            description=(
+                "Number of child stream contexts fetched concurrently "
+                "(capped to the 10 simultaneous requests allowed by the API)"
+            ),
+        ),
+        th.Property(
+            "newsletter_activity_days",
+            th.IntegerType,
+            description=(
+                "Skip the activities of newsletters sent more than this number of "
+                "days ago. All newsletters by default"
+            ),
+        ),
+        th.Property(
+            "filters",
+            th.ObjectType(
+                additional_properties=th.ObjectType(
+                    additional_properties=th.CustomType(
+                        {"type": ["string", "number", "boolean", "object"]},
+                    ),
+                ),
+            ),
+            description=(
+                "Server-side filters of the list streams, by stream name: a value, "
+                "or `from` and `to` bounds, per filtered field"
+            ),
+        ),
+        th.Property(
+            "campaign_ids",
+            th.ArrayType(th.StringType),
+            description=(
+                "IDs of the campaigns (lists) to sync, with their details and "
+                "contacts. All campaigns by default"
+            ),
+        ),
+        th.Property(
+            "contacts_partitioning",
+            th.StringType,
+            allowed_values=["campaign", "created_on"],
+            description=(
+                "Split the contacts listing in partitions requested concurrently: "
+                "one per campaign, or one per range of creation dates"
+            ),
+        ),
+        th.Property(
+            "contacts_partition_days",
+            th.IntegerType,
+            default=90,
+            description="Number of days of creation dates per contacts partition",
+        ),
+        th.Property(
+            "hydrate_from_parent",
+            th.BooleanType,
+            default=False,
+            description=(
+                "Build detail records (`contact_details`) from the parent listing, "
+                "requesting one detail per parent only for fields it lacks"
+            ),
+        ),
+        th.Property(
+            "page_prefetch_window",
+            th.IntegerType,
+            default=1,
+            description=(
+                "Number of pages of a listing requested concurrently once the total "
+                "number of pages is known (capped to 10)"
+            ),
+        ),
+        th.Property(
+            "adaptive_page_size",
+            th.BooleanType,
+            default=False,
+            description=(
+                "Adapt the number of records per page of each stream to its response "
+                "time and size, instead of always requesting `per_page` records"
+            ),
+        ),
+        th.Property(
+            "target_page_seconds",
+            th.NumberType,
+            default=2.0,
+            description="Response time budget of a page, with `adaptive_page_size`",
+        ),
+        th.Property(
+            "target_page_bytes",
+            th.IntegerType,
+            default=1_000_000,
+            description="Response size budget of a page, with `adaptive_page_size`",
+        ),
+        th.Property(
+            "stream_responses",
+            th.BooleanType,
+            default=False,
+            description=(
+                "Parse records while the response body is received, instead of "
+                "loading whole pages in memory"
+            ),
+        ),
+        th.Property(
+            "fast_emission",
+            th.BooleanType,
+            default=False,
+            description=(
+                "Skip the type conformance of records, validate a sample of them "
+                "against the schema, and serialize them with orjson when installed"
+            ),
+        ),
+        th.Property(
+            "validation_sample_rate",
+            th.NumberType,
+            default=0.01,
+            description="Fraction of the records validated, with `fast_emission`",
+        ),
+        th.Property(
+            "metrics_textfile",
+            th.StringType,
+            description=(
+                "Path of a Prometheus textfile where the time spent in each sync "
+                "phase is written at exit"
+            ),
+        ),
+        th.Property(
+            "cache_path",
+            th.StringType,
+            description=(
+                "Path of a SQLite file caching detail responses, revalidated with "
+                "conditional requests on the next runs"
+            ),
+        ),
+        th.Property(
+            "cache_ttl_days",
+            th.IntegerType,
+            default=30,
+            description="Number of days a cached response is kept without revalidation",
+        ),
+        th.Property(
+            "cache_max_mb",
+            th.IntegerType,
+            default=512,
+            description="Maximum size of the cached responses, in MiB",
+        ),
+        th.Property(
+            "fingerprint_path",
+            th.StringType,
+            description=(
+                "Path of a SQLite file indexing the version of each parent record, "
+                "so that detail streams skip parents unchanged since the last sync"
+            ),
+        ),
+        th.Property(
+            "freeze_finished_newsletters",
+            th.BooleanType,
+            default=False,
+            description=(
+                "Stop syncing `newsletter_details` for newsletters already synced "
+                "once their sending is finished"
+            ),
+        ),
+        th.Property(
+            "frozen_refresh_days",
+            th.IntegerType,
+            description=(
+                "Number of days after which the details of finished newsletters are "
+                "synced again (never by default)"
+            ),
+        ),
+        th.Property(
+            "async_engine",
+            th.BooleanType,
+            default=False,
+            description=(
+                "Send requests as coroutines on an asyncio event loop with httpx, "
+                "instead of worker threads (requires the `async` extra)"
+            ),
+        ),
+        th.Property(
+            "pool_size",
+            th.IntegerType,
+            default=MAX_CONCURRENT_REQUESTS,
+            description="Maximum number of keep-alive connections kept open to the API",
         ),
     ).to_dict()
 
+    def __init__(self, *args: t.Any, **kwargs: t.Any) -> None:
+        """Initialize the tap, its per-account rate limiters and request slots."""
+        self._rate_limiters: dict[str | None, RateLimiter] = {}
+        self._rate_limiters_lock = threading.Lock()
+        #: Bounds the requests in flight across all streams and threads.
+        self.request_slots = threading.BoundedSemaphore(MAX_CONCURRENT_REQUESTS)
+        self._finalizers: list[weakref.finalize] = []
+        super().__init__(*args, **kwargs)
+
+    def _on_close(self, callback: t.Callable[..., None], *args: t.Any) -> None:
+        """Register a callback run by :meth:`close`, or at exit at the latest.
+
+        Callbacks must not reference the tap, so that it can be garbage collected.
+
+        Args:
+            callback: The callback.
+            args: The callback arguments.
+        """
+        self._finalizers.append(weakref.finalize(self, callback, *args))
+
+    def close(self) -> None:
+        """Export the sync phase timings and release the resources shared by streams.
+
+        This runs once, after the sync: when called, when the tap is garbage
+        collected, or when the process exits, whichever comes first.
+        """
+        for finalizer in reversed(self._finalizers):
+            finalizer()
+
+    @cached_property
+    def accounts(self) -> dict[str, dict[str, t.Any]]:
+        """Return the configured accounts, by account ID.
+
+        Returns:
+            The accounts, empty when a single ``auth_token`` is configured.
+
+        Raises:
+            ConfigValidationError: If neither accounts nor a token are configured.
+        """
+        accounts = {
+            account["account_id"]: account
+            for account in self.config.get("accounts") or []
+        }
+        if not accounts and not self.config.get("auth_token"):
+            msg = "Either `auth_token` or `accounts` must be set"
+            raise ConfigValidationError(msg)
+        return accounts
+
+    def get_account(self, context: dict | None) -> dict[str, t.Any] | None:
+        """Return the account of a stream context.
+
+        Args:
+            context: The stream context.
+
+        Returns:
+            The account settings, or ``None`` for the ``auth_token`` account.
+        """
+        if not context or ACCOUNT_ID_KEY not in context:
+            return None
+        return self.accounts[context[ACCOUNT_ID_KEY]]
+
+    @staticmethod
+    def get_account_headers(account: dict[str, t.Any]) -> dict[str, str]:
+        """Return the HTTP headers identifying the requests of an account.
+
+        Args:
+            account: The account settings.
+
+        Returns:
+            A dictionary of HTTP headers.
+        """
+        headers = {"X-Auth-Token": f"api-key {account['auth_token']}"}
+        if account.get("domain"):
+            headers["X-Domain"] = account["domain"]
+        return headers
+
+    def get_rate_limiter(self, context: dict | None) -> RateLimiter:
+        """Return the rate limiter of the account of a stream context.
+
+        The API quota is per account: requests of all streams of an account share
+        one rate limiter.
+
+        Args:
+            context: The stream context.
+
+        Returns:
+            A rate limiter instance.
+        """
+        account_id = (context or {}).get(ACCOUNT_ID_KEY)
+        with self._rate_limiters_lock:
+            if account_id not in self._rate_limiters:
+                self._rate_limiters[account_id] = RateLimiter()
+            return self._rate_limiters[account_id]
+
+    @cached_property
+    def performance(self) -> PerformanceStats:
+        """Return the phase timings shared by all streams.
+
+        Returns:
+            A performance statistics instance.
+        """
+        performance = PerformanceStats()
+        self._on_close(
+            _export_performance,
+            performance,
+            self.metrics_logger,
+            self.config.get("metrics_textfile"),
+        )
+        return performance
+
+    @cached_property
+    def response_cache(self) -> ResponseCache | None:
+        """Return the response cache shared by all streams, if configured.
+
+        Returns:
+            A response cache instance, or ``None``.
+        """
+        if not self.config.get("cache_path"):
+            return None
+        cache = ResponseCache(
+            self.config["cache_path"],
+            ttl=self.config.get("cache_ttl_days", 30) * 24 * 3600,
+            max_bytes=self.config.get("cache_max_mb", 512) * 1024 * 1024,
+        )
+        self._on_close(_close_response_cache, cache, self.logger)
+        return cache
+
+    @cached_property
+    def fingerprint_index(self) -> FingerprintIndex | None:
+        """Return the parent fingerprint index shared by all streams, if configured.
+
+        Returns:
+            A fingerprint index instance, or ``None``.
+        """
+        if not self.config.get("fingerprint_path"):
+            return None
+        index = FingerprintIndex(self.config["fingerprint_path"])
+        self._on_close(index.close)
+        return index
+
+    @cached_property
+    def async_engine(self) -> AsyncEngine | None:
+        """Return the async engine shared by all streams, if enabled.
+
+        Returns:
+            An async engine instance, or ``None``.
+        """
+        if not self.config.get("async_engine", False):
+            return None
+        engine = AsyncEngine(
+            concurrency=MAX_CONCURRENT_REQUESTS,
+            pool_size=self.config.get("pool_size", MAX_CONCURRENT_REQUESTS),
+        )
+        self._on_close(engine.close)
+        return engine
+
+    @cached_property
+    def requests_session(self) -> requests.Session:
+        """Return the HTTP session shared by all streams.
+
+        Connections are kept alive and reused across streams, pages and workers.
+
+        Returns:
+            A `requests.Session` object.
+        """
+        session = requests.Session()
+        adapter = self.get_http_adapter()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def get_http_adapter(self) -> HTTPAdapter:
+        """Return the transport adapter mounted on the shared HTTP session.
+
+        Override this method to plug another transport, e.g. an HTTP/2 adapter.
+
+        Returns:
+            A transport adapter instance.
+        """
+        pool_size = self.config.get("pool_size", MAX_CONCURRENT_REQUESTS)
+        # Keep a connection pool per API host, so accounts on different hosts do
+        # not evict each other's keep-alive connections.
+        hosts = {
+            urlsplit(url).netloc
+            for url in [
+                self.config.get("base_url", DEFAULT_BASE_URL),
+                *(account.get("base_url") for account in self.accounts.values()),
+            ]
+            if url
+        }
+        return HTTPAdapter(
+            pool_connections=max(len(hosts), 10),
+            pool_maxsize=pool_size,
+        )
+
+    def get_authenticator(self, stream: GetResponseStream) -> APIKeyAuthenticator:
+        """Return the authenticator shared by all streams.
+
+        Args:
+            stream: The stream requesting the authenticator.
+
+        Returns:
+            An authenticator instance, created for the first requesting stream.
+        """
+        if self._authenticator is None:
+            self._authenticator = APIKeyAuthenticator.create_for_stream(
+                stream,
+                key="X-Auth-Token",
+                value=f"api-key {self.config.get('auth_token', '')}",
+                location="header",
+            )
+        return self._authenticator
+
     def discover_streams(self) -> list[GetResponseStream]:
         """Return a list of discovered streams.
 
         Returns:
             A list of discovered streams.
         """
-        return [
+        discovered = [
             streams.CampaignsStream(self),
             streams.CampaignDetailsStream(self),
+            streams.CampaignContactsStream(self),
+            streams.CampaignStatisticsSummaryStream(self),
             streams.ContactsStream(self),
             streams.ContactDetailsStream(self),
             streams.ContactActivitiesStream(self),
             streams.NewslettersStream(self),
             streams.NewsletterDetailsStream(self),
             streams.NewsletterActivitiesStream(self),
+            streams.NewsletterStatisticsStream(self),
             streams.WebinarsStream(self),
             streams.SmsStream(self),
         ]
+        self.validate_filters(discovered)
+        self.validate_day_settings()
+        return discovered
+
+    def validate_filters(self, discovered: list[GetResponseStream]) -> None:
+        """Check that the ``filters`` setting only uses filters the API supports.
+
+        Args:
+            discovered: The discovered streams.
+
+        Raises:
+            ConfigValidationError: If a stream is unknown or cannot be filtered so.
+        """
+        names = {stream.name for stream in discovered}
+        unknown = sorted(set(self.config.get("filters") or {}) - names)
+        if unknown:
+            msg = f"Unknown streams in `filters`: {', '.join(unknown)}"
+            raise ConfigValidationError(msg)
+        for stream in discovered:
+            stream.query_filters  # noqa: B018
+
+    def validate_day_settings(self) -> None:
+        """Check that the settings counting days of a date range count at least one.
+
+        Raises:
+            ConfigValidationError: If a setting is lower than 1.
+        """
+        for name in ("date_window_days", "contacts_partition_days"):
+            value = self.config.get(name)
+            if value is not None and value < 1:
+                msg = f"`{name}` must be at least 1, got {value}"
+                raise ConfigValidationError(msg)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,191 @@
+"""Offline throughput benchmark of the tap against the local mock API.
+
+Each stream is synced on its own, parents included when needed, and the
+following figures are reported per stream: records/sec, requests/sec, peak
+memory allocated by Python and time to first record. Allocations are traced with
+``tracemalloc``, which slows the syncs down: only compare figures measured the same
+way.
+
+Usage:
+
+    python -m tests.benchmark --records 5000 --latency 0.05 \
+        --config '{"max_workers": 5, "page_prefetch_window": 4}'
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import json
+import re
+import time
+import tracemalloc
+import typing as t
+from dataclasses import dataclass, field
+
+from tap_getresponse.tap import TapGetResponse
+from tests.mock_api import MockGetResponseAPI
+
+_RECORD_PATTERN = re.compile(r'"type":\s*"RECORD",\s*"stream":\s*"([^"]+)"')
+
+
+@dataclass
+class StreamBenchmark:
+    """Figures measured while syncing a stream."""
+
+    stream: str
+    records: int = 0
+    requests: int = 0
+    duration: float = 0.0
+    time_to_first_record: float | None = None
+    peak_memory_mb: float = 0.0
+    record_counts: dict[str, int] = field(default_factory=dict)
+    messages: list[dict[str, t.Any]] = field(default_factory=list)
+
+    @property
+    def records_per_second(self) -> float:
+        """Return the number of records of the stream emitted per second."""
+        return self.records / self.duration if self.duration else 0.0
+
+    @property
+    def requests_per_second(self) -> float:
+        """Return the number of API requests sent per second."""
+        return self.requests / self.duration if self.duration else 0.0
+
+
+class _RecordSink:
+    """Stand-in for stdout counting the RECORD messages written by the tap."""
+
+    def __init__(self, start: float, *, keep_messages: bool = False) -> None:
+        self.start = start
+        self.counts: dict[str, int] = {}
+        self.first_record: dict[str, float] = {}
+        self.messages: list[dict[str, t.Any]] | None = [] if keep_messages else None
+
+    def write(self, data: str) -> int:
+        for line in data.splitlines():
+            if self.messages is not None and line.strip():
+                self.messages.append(json.loads(line))
+            match = _RECORD_PATTERN.search(line, 0, 200)
+            if match:
+                stream = match.group(1)
+                if stream not in self.first_record:
+                    self.first_record[stream] = time.perf_counter() - self.start
+                self.counts[stream] = self.counts.get(stream, 0) + 1
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+
+def run_stream(
+    api: MockGetResponseAPI,
+    stream_name: str,
+    config: dict[str, t.Any] | None = None,
+    state: dict[str, t.Any] | None = None,
+    *,
+    keep_messages: bool = False,
+) -> StreamBenchmark:
+    """Sync a single stream against the mock API and measure it.
+
+    Args:
+        api: The started mock API.
+        stream_name: The stream to sync.
+        config: Extra tap settings.
+        state: The state to start from, updated in place with the final state.
+        keep_messages: Whether to keep the messages written by the tap, decoded.
+
+    Returns:
+        The figures measured during the sync.
+    """
+    tap = TapGetResponse(
+        config={"auth_token": "benchmark", "base_url": api.url, **(config or {})},
+        state=state,
+    )
+    for name, stream in tap.streams.items():
+        stream.selected = name == stream_name
+
+    api.requests.clear()
+    api.not_modified.clear()
+    tracing = tracemalloc.is_tracing()
+    if tracing:
+        tracemalloc.reset_peak()
+    else:
+        tracemalloc.start()
+    start = time.perf_counter()
+    sink = _RecordSink(start, keep_messages=keep_messages)
+    try:
+        with contextlib.redirect_stdout(sink):  # type: ignore[type-var]
+            tap.sync_all()
+            tap.close()
+        duration = time.perf_counter() - start
+        peak_memory = tracemalloc.get_traced_memory()[1]
+    finally:
+        if not tracing:
+            tracemalloc.stop()
+    if state is not None:
+        state.update(tap.state)
+
+    return StreamBenchmark(
+        stream=stream_name,
+        records=sink.counts.get(stream_name, 0),
+        requests=sum(api.requests.values()),
+        duration=duration,
+        time_to_first_record=sink.first_record.get(stream_name),
+        peak_memory_mb=peak_memory / 1024 / 1024,
+        record_counts=sink.counts,
+        messages=sink.messages or [],
+    )
+
+
+def main(argv: list[str] | None = None) -> list[StreamBenchmark]:
+    """Run the benchmark from the command line.
+
+    Args:
+        argv: The command line arguments.
+
+    Returns:
+        The figures measured for each stream.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=1000)
+    parser.add_argument("--activities", type=int, default=2)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--payload-size", type=int, default=0)
+    parser.add_argument("--rate-limit", type=int, default=1_000_000)
+    parser.add_argument("--config", type=json.loads, default={})
+    parser.add_argument("--streams", nargs="*")
+    args = parser.parse_args(argv)
+
+    api = MockGetResponseAPI(
+        records=args.records,
+        activities=args.activities,
+        latency=args.latency,
+        payload_size=args.payload_size,
+        rate_limit=args.rate_limit,
+    )
+    stream_names = args.streams or list(
+        TapGetResponse(config={"auth_token": "benchmark"}).streams,
+    )
+
+    results = []
+    print(  # noqa: T201
+        f"{'stream':<24}{'records':>9}{'requests':>10}{'rec/s':>10}"
+        f"{'req/s':>9}{'TTFR (s)':>10}{'peak mem (MiB)':>16}",
+    )
+    with api:
+        for stream_name in stream_names:
+            result = run_stream(api, stream_name, args.config)
+            results.append(result)
+            ttfr = result.time_to_first_record
+            print(  # noqa: T201
+                f"{result.stream:<24}{result.records:>9}{result.requests:>10}"
+                f"{result.records_per_second:>10.0f}{result.requests_per_second:>9.0f}"
+                f"{'-' if ttfr is None else f'{ttfr:.3f}':>10}"
+                f"{result.peak_memory_mb:>16.1f}",
+            )
+    return results
+
+
+if __name__ == "__main__":
+    main()
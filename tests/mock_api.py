@@ -0,0 +1,364 @@
+"""Local stand-in for the GetResponse API, used by offline tests and benchmarks.
+
+The server answers the endpoints synced by the tap with generated records. It
+honours the `page`, `perPage` and `fields` parameters, filters contacts on
+their campaign and creation date, returns the `CurrentPage`,
+`TotalPages` and `X-RateLimit-*` headers, answers single resources with an
+`ETag` honoured by `If-None-Match`, and can add latency and padding to emulate
+slow or heavy responses.
+"""
+
+from __future__ import annotations
+
+import collections
+import datetime
+import hashlib
+import json
+import re
+import socket
+import threading
+import time
+import typing as t
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+BASE_PATH = "/v3"
+
+
+class MockGetResponseAPI:
+    """Serve generated GetResponse resources on a local port."""
+
+    def __init__(
+        self,
+        *,
+        records: int = 100,
+        activities: int = 2,
+        latency: float = 0.0,
+        payload_size: int = 0,
+        rate_limit: int = 1_000_000,
+        rate_limit_window: int = 600,
+    ) -> None:
+        """Create a new mock API.
+
+        Args:
+            records: Number of records of each listing endpoint.
+            activities: Number of activities returned per contact or newsletter.
+            latency: Seconds waited before answering each request.
+            payload_size: Number of padding characters added to each record.
+            rate_limit: Number of requests allowed per rate limit window.
+            rate_limit_window: Duration of the rate limit window, in seconds.
+        """
+        self.records = records
+        self.activities = activities
+        self.latency = latency
+        self.payload_size = payload_size
+        self.rate_limit = rate_limit
+        self.rate_limit_window = rate_limit_window
+        self.requests: collections.Counter[str] = collections.Counter()
+        self.not_modified: collections.Counter[str] = collections.Counter()
+        self._window_start = time.monotonic()
+        self._lock = threading.Lock()
+        self._server: ThreadingHTTPServer | None = None
+
+        self._routes: list[tuple[re.Pattern, str, t.Callable[..., t.Any]]] = [
+            (re.compile(pattern), template, handler)
+            for pattern, template, handler in [
+                (r"/campaigns", "/campaigns", self._campaigns),
+                (r"/campaigns/(\w+)", "/campaigns/{campaignId}", self._campaign),
+                (
+                    r"/campaigns/(\w+)/contacts",
+                    "/campaigns/{campaignId}/contacts",
+                    self._campaign_contacts,
+                ),
+                (r"/contacts", "/contacts", self._contacts),
+                (r"/contacts/(\w+)", "/contacts/{contactId}", self._contact),
+                (
+                    r"/contacts/(\w+)/activities",
+                    "/contacts/{contactId}/activities",
+                    self._activities,
+                ),
+                (r"/newsletters", "/newsletters", self._newsletters),
+                (
+                    r"/newsletters/(\w+)",
+                    "/newsletters/{newsletterId}",
+                    self._newsletter,
+                ),
+                (
+                    r"/newsletters/(\w+)/activities",
+                    "/newsletters/{newsletterId}/activities",
+                    self._activities,
+                ),
+                (
+                    r"/newsletters/(\w+)/statistics",
+                    "/newsletters/{newsletterId}/statistics",
+                    self._newsletter_statistics,
+                ),
+                (
+                    r"/campaigns/statistics/summary",
+                    "/campaigns/statistics/summary",
+                    self._campaign_statistics,
+                ),
+                (r"/sms", "/sms", self._sms),
+                (r"/webinars", "/webinars", self._webinars),
+            ]
+        ]
+
+    @property
+    def url(self) -> str:
+        """Return the base URL of the API."""
+        assert self._server is not None, "The mock API is not started"  # noqa: S101
+        return f"http://127.0.0.1:{self._server.server_port}{BASE_PATH}"
+
+    def start(self) -> MockGetResponseAPI:
+        """Start serving requests in a background thread."""
+        api = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def setup(self) -> None:
+                super().setup()
+                # Headers and body are written separately: avoid delayed ACK stalls.
+                self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+            def do_GET(self) -> None:  # noqa: N802
+                api._handle(self)  # noqa: SLF001
+
+            def log_message(self, *args: t.Any) -> None:
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving requests."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+
+    def __enter__(self) -> MockGetResponseAPI:
+        return self.start()
+
+    def __exit__(self, *args: object) -> None:
+        self.stop()
+
+    # Request handling
+
+    def _handle(self, request: BaseHTTPRequestHandler) -> None:
+        url = urlparse(request.path)
+        params = {key: values[0] for key, values in parse_qs(url.query).items()}
+        path = url.path[len(BASE_PATH) :]
+
+        for pattern, *route in self._routes:
+            match = pattern.fullmatch(path)
+            if match:
+                template, handler = route
+                break
+        else:
+            self._send(request, HTTPStatus.NOT_FOUND, {"message": "Not found"})
+            return
+
+        remaining, reset = self._consume_quota(template)
+        headers = {
+            "X-RateLimit-Limit": str(self.rate_limit),
+            "X-RateLimit-Remaining": str(max(remaining, 0)),
+            "X-RateLimit-Reset": f"{reset} seconds",
+        }
+        if remaining < 0:
+            body = {"message": "Too many requests"}
+            self._send(request, HTTPStatus.TOO_MANY_REQUESTS, body, headers)
+            return
+
+        time.sleep(self.latency)
+        body = handler(*match.groups(), params=params)
+        if isinstance(body, list):
+            page = int(params.get("page", 1))
+            per_page = int(params.get("perPage", 100))
+            headers["CurrentPage"] = str(page)
+            headers["TotalPages"] = str(max(-(-len(body) // per_page), 1))
+            body = body[(page - 1) * per_page : page * per_page]
+        if "fields" in params:
+            body = self._select_fields(body, params["fields"].split(","))
+        if isinstance(body, dict):
+            digest = hashlib.sha256(json.dumps(body).encode()).hexdigest()
+            headers["ETag"] = f'"{digest}"'
+            if request.headers.get("If-None-Match") == headers["ETag"]:
+                self.not_modified[template] += 1
+                request.send_response(HTTPStatus.NOT_MODIFIED)
+                for key, value in headers.items():
+                    request.send_header(key, value)
+                request.end_headers()
+                return
+        self._send(request, HTTPStatus.OK, body, headers)
+
+    def _consume_quota(self, template: str) -> tuple[int, int]:
+        with self._lock:
+            now = time.monotonic()
+            if now - self._window_start >= self.rate_limit_window:
+                self._window_start = now
+                self.requests.clear()
+            self.requests[template] += 1
+            remaining = self.rate_limit - sum(self.requests.values())
+            reset = int(self.rate_limit_window - (now - self._window_start))
+        return remaining, reset
+
+    @staticmethod
+    def _select_fields(body: t.Any, fields: list[str]) -> t.Any:  # noqa: ANN401
+        if isinstance(body, list):
+            return [{key: row.get(key) for key in fields} for row in body]
+        return {key: body.get(key) for key in fields}
+
+    @staticmethod
+    def _send(
+        request: BaseHTTPRequestHandler,
+        status: HTTPStatus,
+        body: t.Any,  # noqa: ANN401
+        headers: dict[str, str] | None = None,
+    ) -> None:
+        data = json.dumps(body).encode()
+        request.send_response(status)
+        request.send_header("Content-Type", "application/json")
+        request.send_header("Content-Length", str(len(data)))
+        for key, value in (headers or {}).items():
+            request.send_header(key, value)
+        request.end_headers()
+        request.wfile.write(data)
+
+    # Generated resources
+
+    def _padding(self) -> str:
+        return "x" * self.payload_size
+
+    def _date(self, index: int) -> str:
+        date = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+        # The API writes offsets without a colon, e.g. 2017-12-19T13:11:48+0000.
+        date += datetime.timedelta(minutes=index)
+        return date.strftime("%Y-%m-%dT%H:%M:%S%z")
+
+    def _campaign(self, campaign_id: str, params: dict) -> dict:  # noqa: ARG002
+        return {
+            "campaignId": campaign_id,
+            "name": f"Campaign {campaign_id}",
+            "description": self._padding(),
+            "isDefault": False,
+            "createdOn": self._date(0),
+            "href": f"{BASE_PATH}/campaigns/{campaign_id}",
+        }
+
+    def _campaigns(self, params: dict) -> list[dict]:
+        return [self._campaign(f"C{i}", params) for i in range(self.records)]
+
+    def _contact(self, contact_id: str, params: dict) -> dict:  # noqa: ARG002
+        index = int(contact_id[1:])
+        return {
+            "contactId": contact_id,
+            "name": f"Contact {index}",
+            "email": f"contact{index}@example.com",
+            "origin": "api",
+            "changedOn": self._date(index),
+            "createdOn": self._date(index * 24 * 60),
+            "campaign": {"campaignId": f"C{index % 3}", "name": f"List {index % 3}"},
+            "href": f"{BASE_PATH}/contacts/{contact_id}",
+            "note": self._padding(),
+            "ipAddress": "127.0.0.1",
+            "customFieldValues": [],
+        }
+
+    def _contacts(self, params: dict) -> list[dict]:
+        contacts = [self._contact(f"c{i}", params) for i in range(self.records)]
+        if "query[campaignId]" in params:
+            campaign_id = params["query[campaignId]"]
+            contacts = [
+                c for c in contacts if c["campaign"]["campaignId"] == campaign_id
+            ]
+        if "query[createdOn][from]" in params:
+            day = params["query[createdOn][from]"]
+            contacts = [c for c in contacts if c["createdOn"][:10] >= day]
+        if "query[createdOn][to]" in params:
+            day = params["query[createdOn][to]"]
+            contacts = [c for c in contacts if c["createdOn"][:10] <= day]
+        return contacts
+
+    def _campaign_contacts(self, campaign_id: str, params: dict) -> list[dict]:
+        return self._contacts({**params, "query[campaignId]": campaign_id})
+
+    def _newsletter(self, newsletter_id: str, params: dict) -> dict:  # noqa: ARG002
+        index = int(newsletter_id[1:])
+        return {
+            "newsletterId": newsletter_id,
+            "name": f"Newsletter {index}",
+            "subject": f"Subject {index}",
+            "type": "broadcast",
+            "status": "enabled",
+            "sendOn": self._date(index),
+            "createdOn": self._date(0),
+            "sendMetrics": {"status": "finished", "sent": "10", "total": "10"},
+            "href": f"{BASE_PATH}/newsletters/{newsletter_id}",
+            "content": {"html": f"<p>{self._padding()}</p>", "plain": ""},
+        }
+
+    def _newsletters(self, params: dict) -> list[dict]:
+        return [self._newsletter(f"n{i}", params) for i in range(self.records)]
+
+    def _activities(self, parent_id: str, params: dict) -> list[dict]:
+        day = params.get("query[createdOn][from]", "2024-01-01")
+        return [
+            {
+                "activity": "open",
+                "subject": f"Activity {i} of {parent_id}",
+                "createdOn": f"{day}T00:{i % 60:02d}:00+0000",
+                "contact": {"contactId": "c0"},
+            }
+            for i in range(self.activities)
+        ]
+
+    def _campaign_statistics(self, params: dict) -> list[dict]:
+        return [
+            {
+                "campaignId": campaign_id,
+                "totalSubscribers": 10,
+                "totalNewsletters": 2,
+                "totalTriggers": 0,
+                "totalLandingPages": 0,
+                "totalWebforms": 1,
+            }
+            for campaign_id in params["query[campaignId]"].split(",")
+        ]
+
+    def _newsletter_statistics(self, newsletter_id: str, params: dict) -> list[dict]:
+        return [
+            {
+                "timeInterval": f"{params.get('groupBy', 'hour')} of {newsletter_id}",
+                "sent": 10,
+                "totalOpened": 5,
+                "uniqueOpened": 4,
+                "totalClicked": 2,
+                "uniqueClicked": 1,
+            },
+        ]
+
+    def _sms(self, params: dict) -> list[dict]:  # noqa: ARG002
+        return [
+            {
+                "smsId": f"s{i}",
+                "name": f"SMS {i}",
+                "content": self._padding(),
+                "type": "sms",
+                "href": f"{BASE_PATH}/sms/s{i}",
+            }
+            for i in range(self.records)
+        ]
+
+    def _webinars(self, params: dict) -> list[dict]:  # noqa: ARG002
+        return [
+            {
+                "webinarId": f"w{i}",
+                "name": f"Webinar {i}{self._padding()}",
+                "status": "finished",
+                "href": f"{BASE_PATH}/webinars/w{i}",
+            }
+            for i in range(self.records)
+        ]
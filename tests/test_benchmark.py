@@ -0,0 +1,260 @@
+"""Tests the offline benchmark harness against the local mock API."""
+
+import pytest
+
+from tap_getresponse.streams import CampaignStatisticsSummaryStream
+from tests.benchmark import StreamBenchmark, run_stream
+from tests.mock_api import MockGetResponseAPI
+
+EXPECTED_RECORDS = {
+    "campaigns": 12,
+    "campaign_details": 12,
+    "contacts": 12,
+    "contact_details": 12,
+    "newsletters": 12,
+    "newsletter_details": 12,
+    "sms": 12,
+    "webinars": 12,
+}
+
+
+def _records(result: StreamBenchmark, stream_name: str) -> list[dict]:
+    """Return the records of a stream written during a benchmark run."""
+    return [
+        message["record"]
+        for message in result.messages
+        if message["type"] == "RECORD" and message["stream"] == stream_name
+    ]
+
+
+def _record_messages(result: StreamBenchmark) -> list[dict]:
+    """Return the RECORD messages of a benchmark run, without extraction times."""
+    return [
+        {key: value for key, value in message.items() if key != "time_extracted"}
+        for message in result.messages
+        if message["type"] == "RECORD"
+    ]
+
+
+@pytest.fixture(scope="module")
+def api():
+    """Start the mock API once for all tests of the module."""
+    with MockGetResponseAPI(records=12) as api:
+        yield api
+
+
+@pytest.mark.parametrize("stream_name", list(EXPECTED_RECORDS))
+def test_benchmark_syncs_stream(api: MockGetResponseAPI, stream_name: str) -> None:
+    """Test that each stream is synced and measured against the mock API."""
+    result = run_stream(api, stream_name, {"per_page": 5})
+
+    assert result.records == EXPECTED_RECORDS[stream_name]
+    assert result.requests > 0
+    assert result.time_to_first_record is not None
+    assert result.peak_memory_mb > 0
+
+
+def test_benchmark_fans_out_children(api: MockGetResponseAPI) -> None:
+    """Test that concurrent settings keep every child record."""
+    config = {"per_page": 5, "max_workers": 4, "page_prefetch_window": 3}
+
+    result = run_stream(api, "contact_details", config)
+
+    assert result.records == EXPECTED_RECORDS["contact_details"]
+
+
+def test_benchmark_writes_phase_timings(api: MockGetResponseAPI, tmp_path) -> None:
+    """Test that the time spent in each sync phase is exported at exit."""
+    textfile = tmp_path / "tap_getresponse.prom"
+
+    run_stream(api, "campaigns", {"per_page": 5, "metrics_textfile": str(textfile)})
+
+    assert textfile.stat().st_mode & 0o777 == 0o644
+    text = textfile.read_text()
+    for phase in ("throttle", "request", "decode", "post_process", "validate", "emit"):
+        labels = f'stream="campaigns",endpoint="/campaigns",phase="{phase}"'
+        assert f"tap_getresponse_phase_count_total{{{labels}}}" in text
+
+
+def test_benchmark_adapts_page_size() -> None:
+    """Test that heavy pages are split without losing records."""
+    config = {"per_page": 40, "adaptive_page_size": True, "target_page_bytes": 2000}
+
+    with MockGetResponseAPI(records=100) as api:
+        result = run_stream(api, "newsletters", config)
+
+    assert result.records == 100
+    # 40 records, then 20, then pages of 10.
+    assert result.requests == 1 + 1 + 4
+
+
+def test_benchmark_revalidates_cached_details(api: MockGetResponseAPI, tmp_path) -> None:
+    """Test that unchanged details are served from the cache on the next run."""
+    config = {"per_page": 5, "cache_path": str(tmp_path / "cache.sqlite")}
+
+    first = run_stream(api, "campaign_details", config)
+    assert not api.not_modified
+
+    second = run_stream(api, "campaign_details", config)
+    assert api.not_modified["/campaigns/{campaignId}"] == 12
+    assert second.records == first.records == EXPECTED_RECORDS["campaign_details"]
+
+
+def test_benchmark_skips_unchanged_parents(api: MockGetResponseAPI, tmp_path) -> None:
+    """Test that details are only synced again for changed parents."""
+    config = {"per_page": 5, "fingerprint_path": str(tmp_path / "index.sqlite")}
+
+    first = run_stream(api, "newsletter_details", config)
+    second = run_stream(api, "newsletter_details", config)
+
+    assert first.records == EXPECTED_RECORDS["newsletter_details"]
+    assert second.records == 0
+    assert "/newsletters/{newsletterId}" not in api.requests
+
+
+def test_benchmark_freezes_finished_newsletters(api: MockGetResponseAPI) -> None:
+    """Test that the details of finished newsletters are synced once."""
+    config = {"per_page": 5, "freeze_finished_newsletters": True}
+    state: dict = {}
+
+    first = run_stream(api, "newsletter_details", config, state)
+    second = run_stream(api, "newsletter_details", config, state)
+    refreshed = run_stream(api, "newsletter_details", {**config, "frozen_refresh_days": 0}, state)
+
+    assert first.records == EXPECTED_RECORDS["newsletter_details"]
+    assert second.records == 0
+    assert refreshed.records == EXPECTED_RECORDS["newsletter_details"]
+
+
+@pytest.mark.parametrize("stream_responses", [False, True])
+def test_benchmark_async_engine(
+    api: MockGetResponseAPI,
+    stream_responses: bool,  # noqa: FBT001
+) -> None:
+    """Test that the async engine keeps every record, in parent order."""
+    pytest.importorskip("httpx")
+    config = {
+        "per_page": 5,
+        "async_engine": True,
+        "max_workers": 4,
+        "page_prefetch_window": 3,
+        "stream_responses": stream_responses,
+    }
+
+    for stream_name in ("newsletters", "contacts", "contact_details"):
+        result = run_stream(api, stream_name, config)
+
+        assert result.records == EXPECTED_RECORDS[stream_name]
+
+
+def test_benchmark_syncs_several_accounts(api: MockGetResponseAPI) -> None:
+    """Test that the records of every account are synced in one run, keyed by it."""
+    accounts = [
+        {"account_id": name, "auth_token": name, "base_url": api.url}
+        for name in ("eu", "us")
+    ]
+    config = {"per_page": 5, "max_workers": 4, "accounts": accounts}
+
+    result = run_stream(api, "contact_details", config, keep_messages=True)
+
+    schema = next(
+        message
+        for message in result.messages
+        if message["type"] == "SCHEMA" and message["stream"] == "contact_details"
+    )
+    assert schema["key_properties"] == ["account_id", "contactId"]
+    records = _records(result, "contact_details")
+    for account_id in ("eu", "us"):
+        account_records = [
+            record for record in records if record["account_id"] == account_id
+        ]
+        assert len(account_records) == EXPECTED_RECORDS["contact_details"]
+    assert len(records) == 2 * EXPECTED_RECORDS["contact_details"]
+
+
+def test_benchmark_fast_emission(api: MockGetResponseAPI) -> None:
+    """Test that fast emission writes the records the SDK would write."""
+    config = {"per_page": 5}
+    fast_config = {**config, "fast_emission": True, "validation_sample_rate": 0.5}
+
+    for stream_name in ("contacts", "newsletter_details"):
+        conformed = run_stream(api, stream_name, config, keep_messages=True)
+        fast = run_stream(api, stream_name, fast_config, keep_messages=True)
+
+        assert len(_records(fast, stream_name)) == EXPECTED_RECORDS[stream_name]
+        assert _record_messages(fast) == _record_messages(conformed)
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        {"contacts_partitioning": "campaign"},
+        {
+            "contacts_partitioning": "created_on",
+            "contacts_partition_days": 365,
+            "start_date": "2024-01-05T00:00:00Z",
+        },
+    ],
+)
+def test_benchmark_partitions_contacts(api: MockGetResponseAPI, config: dict) -> None:
+    """Test that partitioned contacts are all synced once, with their children."""
+    config = {"per_page": 5, "max_workers": 3, **config}
+    state: dict = {}
+
+    result = run_stream(api, "contact_details", config, state)
+
+    assert result.records == EXPECTED_RECORDS["contact_details"]
+    partitions = state["bookmarks"]["contacts"]["partitions"]
+    assert len(partitions) > 1
+    assert all("contactId" not in partition["context"] for partition in partitions)
+
+
+def test_benchmark_campaign_contacts(api: MockGetResponseAPI) -> None:
+    """Test that only the contacts of the configured campaigns are synced."""
+    config = {"per_page": 5, "campaign_ids": ["C0", "C2"]}
+
+    result = run_stream(api, "campaign_contacts", config)
+
+    assert result.records == 8
+
+
+def test_benchmark_batches_campaign_statistics(
+    api: MockGetResponseAPI,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that campaign statistics are requested for many campaigns at once."""
+    monkeypatch.setattr(CampaignStatisticsSummaryStream, "batch_size", 5)
+
+    result = run_stream(api, "campaign_statistics_summary", {"per_page": 5})
+
+    assert result.records == EXPECTED_RECORDS["campaigns"]
+    assert api.requests["/campaigns/statistics/summary"] == 3
+
+
+def test_benchmark_newsletter_statistics(api: MockGetResponseAPI) -> None:
+    """Test that one row of total statistics is synced per newsletter."""
+    result = run_stream(api, "newsletter_statistics", {"per_page": 5})
+
+    assert result.records == EXPECTED_RECORDS["newsletters"]
+
+
+def test_benchmark_skips_newsletters_beyond_activity_horizon(
+    api: MockGetResponseAPI,
+) -> None:
+    """Test that activities are only requested for recently sent newsletters."""
+    config = {
+        "per_page": 5,
+        "start_date": "2024-01-01T00:00:00Z",
+        "date_window_days": 365,
+    }
+
+    recent = run_stream(api, "newsletter_activities", config)
+    stale = run_stream(
+        api,
+        "newsletter_activities",
+        {**config, "newsletter_activity_days": 30},
+    )
+
+    assert recent.records > 0
+    assert stale.records == 0
+    assert api.requests["/newsletters/{newsletterId}/activities"] == 0
@@ -0,0 +1,47 @@
+"""Tests the on-disk response cache."""
+
+import time
+
+from tap_getresponse.cache import ResponseCache, content_hash
+
+
+def test_cache_keeps_server_validators_only(tmp_path) -> None:
+    """Test that only validators sent by the API are kept for revalidation."""
+    cache = ResponseCache(str(tmp_path / "cache.sqlite"), ttl=60, max_bytes=1000)
+
+    cache.put("https://api/a", b"{}", etag='"a"')
+    cache.put("https://api/b", b"[]")
+
+    assert cache.get("https://api/a").etag == '"a"'
+    assert cache.get("https://api/b").etag is None
+    assert cache.get("https://api/b").digest == content_hash(b"[]")
+    assert cache.get("https://api/c") is None
+
+
+def test_cache_refreshes_unchanged_bodies(tmp_path) -> None:
+    """Test that downloading an unchanged body only refreshes its entry."""
+    cache = ResponseCache(str(tmp_path / "cache.sqlite"), ttl=60, max_bytes=1000)
+    cache.put("https://api/a", b"{}")
+    cache._connection.execute("UPDATE responses SET stored_at = 0")  # noqa: SLF001
+
+    cache.put("https://api/a", b"{}")
+    assert cache.get("https://api/a") is not None
+
+    cache.put("https://api/a", b"[]")
+    assert cache.get("https://api/a").body == b"[]"
+
+
+def test_cache_evicts_least_recently_used_entries(tmp_path) -> None:
+    """Test that the oldest entries are dropped once the size cap is exceeded."""
+    cache = ResponseCache(str(tmp_path / "cache.sqlite"), ttl=60, max_bytes=10)
+    for url in ("a", "b", "c"):
+        cache.put(url, b"12345")
+        time.sleep(0.01)
+    cache.touch("a")
+
+    cache.close()
+
+    cache = ResponseCache(str(tmp_path / "cache.sqlite"), ttl=60, max_bytes=10)
+    assert cache.get("a") is not None
+    assert cache.get("b") is None
+    assert cache.get("c") is not None
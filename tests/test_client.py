@@ -0,0 +1,307 @@
+"""Tests GetResponse stream behaviours that do not require the live API."""
+
+import threading
+import time
+import typing as t
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import requests
+from singer_sdk.exceptions import ConfigValidationError
+
+from tap_getresponse.client import MAX_CONCURRENT_REQUESTS
+from tap_getresponse.tap import TapGetResponse
+
+SAMPLE_CONFIG = {
+    "auth_token": "test-token",
+    "start_date": "2024-01-05T00:00:00Z",
+}
+
+
+def test_contacts_bookmark_pushdown() -> None:
+    """Test that the contacts bookmark is sent as a server-side filter."""
+    tap = TapGetResponse(config=SAMPLE_CONFIG)
+    tap.streams["contact_activities"].selected = False
+    stream = tap.streams["contacts"]
+    stream._write_starting_replication_value(None)  # noqa: SLF001
+
+    params = stream.get_url_params(context=None, next_page_token=None)
+
+    assert params["sort[changedOn]"] == "ASC"
+    assert params["query[changedOn][from]"] == "2024-01-05"
+
+
+def test_contacts_listed_in_full_for_activities() -> None:
+    """Test that unchanged contacts are listed while their activity is synced."""
+    tap = TapGetResponse(config=SAMPLE_CONFIG)
+    stream = tap.streams["contacts"]
+    stream._write_starting_replication_value(None)  # noqa: SLF001
+
+    params = stream.get_url_params(context=None, next_page_token=None)
+
+    assert params["sort[changedOn]"] == "ASC"
+    assert "query[changedOn][from]" not in params
+
+
+def test_streams_share_session_and_authenticator() -> None:
+    """Test that the HTTP session and authenticator are created once per tap."""
+    tap = TapGetResponse(config=SAMPLE_CONFIG)
+    contacts = tap.streams["contacts"]
+    newsletters = tap.streams["newsletters"]
+
+    assert contacts.requests_session is newsletters.requests_session
+    assert contacts.authenticator is newsletters.authenticator
+
+
+def test_selected_fields_are_requested() -> None:
+    """Test that deselected properties are not requested from the API."""
+    tap = TapGetResponse(config=SAMPLE_CONFIG)
+    stream = tap.streams["newsletter_details"]
+    stream.mask[("properties", "content")] = False
+    stream.mask[("properties", "attachments")] = False
+
+    fields = stream.get_url_params(context=None, next_page_token=None)["fields"]
+
+    assert "newsletterId" in fields.split(",")
+    assert "content" not in fields.split(",")
+    assert "attachments" not in fields.split(",")
+
+
+def test_parent_synced_for_children_requests_keys_only() -> None:
+    """Test that an unselected parent stream only requests its primary keys."""
+    tap = TapGetResponse(config=SAMPLE_CONFIG)
+    stream = tap.streams["newsletters"]
+    stream.selected = False
+
+    params = stream.get_url_params(context=None, next_page_token=None)
+
+    assert params["fields"] == "newsletterId"
+
+
+def test_contact_details_hydrated_from_listing() -> None:
+    """Test that contact details are built from the listing when fields allow it."""
+    tap = TapGetResponse(config={**SAMPLE_CONFIG, "hydrate_from_parent": True})
+    contacts = tap.streams["contacts"]
+    details = tap.streams["contact_details"]
+    details.mask[("properties", "note")] = False
+    fields = set(details.get_selected_fields() or [])
+    record = {name: f"{name}-value" for name in fields}
+    expected = dict(record)
+    contacts._current_record = record  # noqa: SLF001
+
+    contacts._hydrate_children({"contactId": "c1"})  # noqa: SLF001
+
+    assert "note" not in fields
+    assert list(details.request_records({"contactId": "c1"})) == [expected]
+    assert set(record) <= set(contacts.schema["properties"])
+
+
+def test_activity_windows_cover_start_date_to_today() -> None:
+    """Test that activities are requested in consecutive date windows."""
+    tap = TapGetResponse(config={**SAMPLE_CONFIG, "date_window_days": 10})
+    stream = tap.streams["newsletter_activities"]
+    context = {"newsletterId": "n1"}
+    stream._write_starting_replication_value(context)  # noqa: SLF001
+
+    windows = stream.get_date_windows(context)
+
+    assert windows[0] == {
+        "query[createdOn][from]": "2024-01-05",
+        "query[createdOn][to]": "2024-01-14",
+    }
+    assert windows[1]["query[createdOn][from]"] == "2024-01-15"
+    assert "query[createdOn][from]" not in stream.get_url_params(context, None)
+
+
+def test_listing_resumes_after_checkpoint() -> None:
+    """Test that an interrupted listing restarts after its last completed page."""
+    checkpoint = {"page": 180, "perPage": 1000, "query": {}}
+    tap = TapGetResponse(
+        config=SAMPLE_CONFIG,
+        state={"bookmarks": {"newsletters": {"checkpoint": checkpoint}}},
+    )
+    stream = tap.streams["newsletters"]
+
+    assert stream._get_resume_page(None, {}) == 181  # noqa: SLF001
+    assert not tap.streams["contacts"].checkpoints_enabled
+    assert not tap.streams["newsletter_details"].checkpoints_enabled
+
+
+def test_accounts_partition_requests() -> None:
+    """Test that each account is synced with its own token, URL and rate limiter."""
+    accounts = [
+        {"account_id": "eu", "auth_token": "eu-token"},
+        {"account_id": "us", "auth_token": "us-token", "base_url": "https://us/v3"},
+    ]
+    tap = TapGetResponse(config={"accounts": accounts})
+    stream = tap.streams["campaigns"]
+
+    assert stream.partitions == [{"account_id": "eu"}, {"account_id": "us"}]
+    assert stream.primary_keys == ["account_id", "campaignId"]
+    assert "account_id" in stream.schema["properties"]
+
+    request = stream.prepare_request({"account_id": "us"}, next_page_token=None)
+    assert request.url.startswith("https://us/v3/campaigns?")
+    assert request.headers["X-Auth-Token"] == "api-key us-token"
+    assert tap.get_rate_limiter({"account_id": "eu"}) is not tap.get_rate_limiter(
+        {"account_id": "us"},
+    )
+
+
+def test_base_url_and_domain() -> None:
+    """Test that requests go to the configured host, with the account domain."""
+    config = {
+        **SAMPLE_CONFIG,
+        "base_url": "https://api3.getresponse360.com/v3/",
+        "domain": "example.com",
+    }
+    stream = TapGetResponse(config=config).streams["sms"]
+
+    request = stream.prepare_request(None, next_page_token=None)
+
+    assert request.url.startswith("https://api3.getresponse360.com/v3/sms?")
+    assert request.headers["X-Domain"] == "example.com"
+
+
+def test_fast_emission_matches_conformed_records() -> None:
+    """Test that fast emission writes the records the SDK would conform."""
+    tap = TapGetResponse(config={**SAMPLE_CONFIG, "fast_emission": True})
+    stream = tap.streams["contacts"]
+    record = {
+        "contactId": "c1",
+        "email": "contact@example.com",
+        "changedOn": "2024-01-05T10:00:00+00:00",
+        "unknown": "dropped",
+    }
+
+    [fast] = stream._generate_fast_record_messages(dict(record))  # noqa: SLF001
+    [conformed] = stream._generate_record_messages(dict(record))  # noqa: SLF001
+
+    assert fast.record == conformed.record
+
+
+def test_filters_are_sent_as_query_parameters() -> None:
+    """Test that stream filters are translated into API query parameters."""
+    filters = {
+        "newsletters": {"status": "enabled", "createdOn": {"from": "2024-01-01"}},
+        "campaigns": {"isDefault": True},
+    }
+    tap = TapGetResponse(config={**SAMPLE_CONFIG, "filters": filters})
+
+    newsletters = tap.streams["newsletters"].get_url_params(None, None)
+    campaigns = tap.streams["campaigns"].get_url_params(None, None)
+
+    assert newsletters["query[status]"] == "enabled"
+    assert newsletters["query[createdOn][from]"] == "2024-01-01"
+    assert campaigns["query[isDefault]"] == "true"
+
+
+@pytest.mark.parametrize(
+    "filters",
+    [
+        {"newsletters": {"email": "a@example.com"}},
+        {"newsletters": {"createdOn": {"after": "2024-01-01"}}},
+        {"unknown": {"name": "x"}},
+    ],
+)
+def test_unsupported_filters_are_rejected(filters: dict) -> None:
+    """Test that filters the API does not support fail the config validation."""
+    with pytest.raises(ConfigValidationError):
+        TapGetResponse(config={**SAMPLE_CONFIG, "filters": filters})
+
+
+@pytest.mark.parametrize("setting", ["date_window_days", "contacts_partition_days"])
+@pytest.mark.parametrize("value", [0, -1])
+def test_empty_date_ranges_are_rejected(setting: str, value: int) -> None:
+    """Test that date ranges of less than a day fail the config validation."""
+    with pytest.raises(ConfigValidationError):
+        TapGetResponse(config={**SAMPLE_CONFIG, setting: value})
+
+
+def test_activities_without_bookmark_are_requested_once() -> None:
+    """Test that a context without bookmark nor start date is not split."""
+    tap = TapGetResponse(config={"auth_token": "test-token"})
+    stream = tap.streams["contact_activities"]
+    context = {"contactId": "c1"}
+    stream._write_starting_replication_value(context)  # noqa: SLF001
+
+    assert stream.get_date_windows(context) == [{}]
+
+
+def test_contacts_date_partitions_are_aligned() -> None:
+    """Test that creation date partitions do not move from one day to the next."""
+    config = {
+        **SAMPLE_CONFIG,
+        "contacts_partitioning": "created_on",
+        "contacts_partition_days": 30,
+    }
+    tap = TapGetResponse(config=config)
+
+    ranges = tap.streams["contacts"].get_date_ranges()
+
+    # 2024-01-05 is in the range starting 19710 days (657 * 30) after 1970-01-01.
+    assert ranges[0] == {"createdOnTo": "2023-12-18"}
+    assert ranges[1] == {"createdOnFrom": "2023-12-19", "createdOnTo": "2024-01-17"}
+    assert all("createdOnTo" in date_range for date_range in ranges)
+
+
+def test_state_written_after_buffered_children(monkeypatch) -> None:
+    """Test that parent state is only emitted once buffered children are synced."""
+    tap = TapGetResponse(config={**SAMPLE_CONFIG, "max_workers": 2})
+    stream = tap.streams["newsletters"]
+    events: list[str] = []
+    monkeypatch.setattr(stream, "_flush_child_contexts", lambda: events.append("sync"))
+    monkeypatch.setattr(
+        "singer_sdk.streams.core.singer.write_message",
+        lambda message: events.append(message.type),
+    )
+    stream._is_state_flushed = False  # noqa: SLF001
+    stream._last_emitted_state = {}  # noqa: SLF001
+    stream.get_context_state(None)["progress_markers"] = {}
+
+    stream._write_state_message()  # noqa: SLF001
+
+    assert events == ["sync", "STATE"]
+
+
+def test_requests_share_the_concurrency_limit(monkeypatch) -> None:
+    """Test that requests sent from any thread share the API concurrency limit."""
+    tap = TapGetResponse(config=SAMPLE_CONFIG)
+    stream = tap.streams["contact_details"]
+    lock = threading.Lock()
+    in_flight = [0, 0]
+
+    def send(request: requests.PreparedRequest, **kwargs: t.Any) -> requests.Response:
+        with lock:
+            in_flight[0] += 1
+            in_flight[1] = max(in_flight)
+        time.sleep(0.01)
+        with lock:
+            in_flight[0] -= 1
+        response = requests.Response()
+        response.status_code = 200
+        response.request = request
+        return response
+
+    monkeypatch.setattr(stream.requests_session, "send", send)
+    request = stream.prepare_request({"contactId": "a"}, next_page_token=None)
+    requests_count = 3 * MAX_CONCURRENT_REQUESTS
+    with ThreadPoolExecutor(max_workers=requests_count) as executor:
+        futures = [
+            executor.submit(stream._request, request, None)  # noqa: SLF001
+            for _ in range(requests_count)
+        ]
+    for future in futures:
+        future.result()
+
+    assert in_flight[1] == MAX_CONCURRENT_REQUESTS
+
+
+def test_page_size_measured_without_content_length() -> None:
+    """Test that chunked responses count towards the page byte budget."""
+    tap = TapGetResponse(config=SAMPLE_CONFIG)
+    stream = tap.streams["newsletters"]
+    response = requests.Response()
+    response._content = b"[]" * 100  # noqa: SLF001
+
+    assert stream._response_size(response) == 200  # noqa: SLF001
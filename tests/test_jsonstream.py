@@ -0,0 +1,38 @@
+"""Tests the incremental JSON parser used for API responses."""
+
+import json
+
+import pytest
+
+from tap_getresponse.jsonstream import iter_json_records
+
+
+def _chunked(payload: str, size: int) -> list:
+    data = payload.encode()
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+@pytest.mark.parametrize("size", [1, 3, 7, 1024])
+def test_iter_json_records_yields_array_elements(size: int) -> None:
+    """Test that array elements are parsed whatever the chunk boundaries."""
+    records = [
+        {"newsletterId": "a", "content": {"html": "<p>héllo, [world]</p>"}},
+        {"newsletterId": "b", "sent": 12345},
+    ]
+
+    parsed = list(iter_json_records(_chunked(json.dumps(records, indent=2), size)))
+
+    assert parsed == records
+
+
+def test_iter_json_records_yields_single_object() -> None:
+    """Test that a detail endpoint object is yielded as one record."""
+    record = {"contactId": "c1", "note": None}
+
+    assert list(iter_json_records(_chunked(json.dumps(record), 4))) == [record]
+
+
+def test_iter_json_records_rejects_truncated_array() -> None:
+    """Test that a truncated body raises an error."""
+    with pytest.raises(ValueError, match="Unexpected end"):
+        list(iter_json_records(_chunked('[{"a": 1}, {"b"', 4)))
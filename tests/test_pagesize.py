@@ -0,0 +1,31 @@
+"""Tests the page size controller."""
+
+from tap_getresponse.pagesize import PageSizeController
+
+
+def test_page_sizes_divide_each_other() -> None:
+    """Test that a listing can always switch to a smaller page size."""
+    controller = PageSizeController(1000)
+
+    assert controller.sizes == [125, 250, 500, 1000]
+    assert PageSizeController(100).sizes == [25, 50, 100, 200, 400, 800]
+
+
+def test_page_size_shrinks_on_slow_or_heavy_pages() -> None:
+    """Test that pages over budget halve the page size, down to the smallest."""
+    controller = PageSizeController(1000, target_seconds=1, target_bytes=1000)
+
+    assert controller.observe(1000, 0.1, 5000) == 500
+    assert controller.observe(500, 3.0, 10) == 250
+    assert controller.shrink(250)
+    assert not controller.shrink(125)
+    assert controller.size == 125
+
+
+def test_page_size_grows_only_at_page_boundaries() -> None:
+    """Test that cheap pages double the page size when the offset allows it."""
+    controller = PageSizeController(250, target_seconds=1, target_bytes=1000)
+
+    assert controller.observe(250, 0.1, 100) == 500
+    assert controller.size_for(250) == 250
+    assert controller.size_for(500) == 500
@@ -0,0 +1,36 @@
+"""Tests the rate limiter fed by the GetResponse rate limit headers."""
+
+import time
+
+from tap_getresponse.ratelimit import RateLimiter
+
+
+def test_rate_limiter_without_headers_does_not_wait() -> None:
+    """Test that requests are not paced before any rate limit header is seen."""
+    rate_limiter = RateLimiter()
+
+    start = time.monotonic()
+    for _ in range(100):
+        rate_limiter.acquire()
+
+    assert time.monotonic() - start < 0.1
+
+
+def test_rate_limiter_paces_requests_over_the_reset_window() -> None:
+    """Test that the remaining budget is spread until the quota reset."""
+    rate_limiter = RateLimiter(reserve=0)
+    rate_limiter.update(
+        {
+            "X-RateLimit-Limit": "30000",
+            "X-RateLimit-Remaining": "10",
+            "X-RateLimit-Reset": "1 seconds",
+        },
+    )
+
+    start = time.monotonic()
+    for _ in range(3):
+        rate_limiter.acquire()
+
+    assert rate_limiter.limit == 30000
+    assert rate_limiter.remaining == 7
+    assert time.monotonic() - start >= 0.15